@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""Replay session payloads through each client's projected hook command and record latency percentiles."""
+from __future__ import annotations
+
+import argparse
+import fcntl
+import glob
+import json
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import sync  # noqa: E402
+
+PERCENTILES = (50, 95, 99)
+MASTER_NAME = "hooks.master.json"
+DRAIN_SETTLE_S = 10.0
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    """Nearest-rank percentile; exact for the small sample counts a hook bench takes."""
+    ordered = sorted(samples)
+    return ordered[max(math.ceil(pct / 100 * len(ordered)) - 1, 0)]
+
+
+def payloads(pattern: str | None, master: dict, agent_key: str, event: str) -> list[bytes]:
+    if pattern:
+        found = [Path(path).read_bytes() for path in sorted(glob.glob(os.path.expanduser(pattern)))]
+        if found:
+            return found
+        sync.warn(f"no payloads match {pattern}; using a synthetic one")
+    synthetic = {
+        "session_id": f"bench-{agent_key}",
+        "cwd": str(sync.repo_root(master)),
+        "hook_event_name": event,
+        "transcript_path": "",
+    }
+    return [json.dumps(synthetic).encode() + b"\n"]
+
+
+def measure(command: str, payload: bytes, env: dict[str, str], timeout_s: float) -> float:
+    started = time.perf_counter()
+    try:
+        subprocess.run(
+            ["/bin/sh", "-c", command],
+            input=payload,
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=timeout_s,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        return timeout_s * 1000
+    return (time.perf_counter() - started) * 1000
+
+
+def scratch_master(master: dict, root: Path) -> dict:
+    """The master's hook dir copied into a scratch repo whose merge-forward worker is a no-op.
+
+    Replays then take the real session-close path, forking a drain worker
+    that runs a tuner, without touching the real spool or tuning anything.
+    """
+    repo = root / "repo"
+    hooks = repo / sync.hook_dir(master).relative_to(sync.repo_root(master))
+    shutil.copytree(sync.hook_dir(master), hooks, ignore=shutil.ignore_patterns("__pycache__"))
+    worker = repo / "skills" / "33god-merge-forward" / "scripts" / "rebalance.py"
+    worker.parent.mkdir(parents=True)
+    worker.write_text("# bench: no-op tuner\n")
+    return sync.load_master(hooks / MASTER_NAME, repo)
+
+
+def settle(lock_path: Path, timeout_s: float) -> None:
+    """Wait, untimed, for the drain a previous replay started to release its lock."""
+    deadline = time.monotonic() + timeout_s
+    with open(lock_path, "a") as lock:
+        while True:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                if time.monotonic() >= deadline:
+                    return
+                time.sleep(0.01)
+                continue
+            fcntl.flock(lock, fcntl.LOCK_UN)
+            return
+
+
+def bench(master: dict, agents: list[str], runs: int, pattern: str | None) -> dict:
+    """Time every (hook, agent) projection; returns {hook_id: {agent: stats}}."""
+    results: dict[str, dict] = {}
+    with tempfile.TemporaryDirectory(prefix="33god-hook-bench-") as root:
+        state = Path(root) / "state"
+        lock_path = state / "33god-merge-forward" / "drain.lock"
+        lock_path.parent.mkdir(parents=True)
+        scratch = scratch_master(master, Path(root))
+        env = dict(
+            os.environ,
+            XDG_STATE_HOME=str(state),
+            CLAUDE_PROJECT_DIR=str(sync.repo_root(scratch)),
+            GOD_MERGE_FORWARD_DEBOUNCE_S="0",
+        )
+        for agent in agents:
+            if agent not in master["agents"] or not master["agents"][agent].get("enabled", True):
+                continue
+            events = master["agents"][agent]["lifecycle_events"]
+            for hook in scratch["hooks"]:
+                event = events.get(hook["lifecycle"])
+                if not event:
+                    continue
+                command = sync.agent_command(scratch, agent, hook)
+                inputs = payloads(pattern, scratch, agent, event)
+                samples = []
+                for i in range(runs):
+                    # Each replay starts with the lock free, as a lone session close does.
+                    settle(lock_path, DRAIN_SETTLE_S)
+                    samples.append(measure(command, inputs[i % len(inputs)], env, hook["timeout_s"]))
+                stats = {f"p{pct}": round(percentile(samples, pct), 2) for pct in PERCENTILES}
+                # Recorded against the real projection, which sync.py --check compares.
+                stats.update(runs=runs, command=sync.agent_command(master, agent, hook))
+                results.setdefault(hook["id"], {})[agent] = stats
+        settle(lock_path, DRAIN_SETTLE_S)
+    return results
+
+
+def save_results(master: dict, results: dict) -> Path:
+    path = sync.bench_path(sync.repo_root(master))
+    merged = sync.load_bench(master)
+    for hook_id, agents in results.items():
+        merged.setdefault(hook_id, {}).update(agents)
+    payload = {
+        "version": sync.STATE_VERSION,
+        "repo": str(sync.repo_root(master)),
+        "measured_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "hooks": merged,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temporary.write_text(json.dumps(payload, indent=2) + "\n")
+    os.replace(temporary, path)
+    return path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target", choices=("all",) + sync.AGENTS, default="all")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--payloads", metavar="GLOB", help="recorded session payloads to replay (default: one synthetic payload per client)")
+    parser.add_argument("--no-save", action="store_true", help="print results without recording them for sync.py --check")
+    args = parser.parse_args()
+
+    master = sync.load_master()
+    results = bench(master, sync.selected(args.target), max(args.runs, 1), args.payloads)
+    hooks = {hook["id"]: hook for hook in master["hooks"]}
+    print(f"{'hook':<36} {'client':<7} {'p50ms':>8} {'p95ms':>8} {'p99ms':>8} {'budget':>8}")
+    for hook_id, agents in results.items():
+        budget = sync.latency_budget_ms(master, hooks[hook_id])
+        for agent, stats in agents.items():
+            flag = "" if stats["p95"] <= budget else "  OVER"
+            print(f"{hook_id:<36} {agent:<7} {stats['p50']:>8.1f} {stats['p95']:>8.1f} {stats['p99']:>8.1f} {budget:>8.0f}{flag}")
+    if not args.no_save:
+        print(f"recorded {save_results(master, results)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
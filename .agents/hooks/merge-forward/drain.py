@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""Drain the session-end spool: debounce, coalesce per repo and session, run each queue's tuner once each."""
+from __future__ import annotations
+
+import argparse
+import fcntl
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+def log(message: str) -> None:
+    stamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    print(f"{stamp} drain[{os.getpid()}] {message}", flush=True)
+
+
+def pending(spool: Path) -> list[Path]:
+    """Spooled payloads across every worker queue, oldest first.
+
+    Each hook spools into ``<spool>/<queue>/<epoch_ns>.<client>.<pid>.json``,
+    one queue per rebalance.py, whose path the queue's ``worker`` file records.
+    """
+    return sorted(
+        (path for path in spool.glob("*/*.json") if not path.name.startswith(".")),
+        key=lambda path: (int(path.name.split(".", 1)[0]) if path.name.split(".", 1)[0].isdigit() else 0, path.name),
+    )
+
+
+def debounce(spool: Path, quiet_s: float, limit_s: float) -> None:
+    """Wait until no payload has arrived for ``quiet_s``, giving up after ``limit_s``."""
+    deadline = time.monotonic() + limit_s
+    while time.monotonic() < deadline:
+        newest = max((path.stat().st_mtime for path in pending(spool) if path.exists()), default=0.0)
+        idle = time.time() - newest
+        if idle >= quiet_s:
+            return
+        time.sleep(min(quiet_s - idle, max(deadline - time.monotonic(), 0)) + 0.05)
+
+
+def session_key(path: Path) -> tuple[str, str]:
+    """(repo, session) a payload belongs to; unparseable payloads never coalesce."""
+    try:
+        payload = json.loads(path.read_text() or "{}")
+    except (OSError, json.JSONDecodeError):
+        return "", path.name
+    if not isinstance(payload, dict):
+        return "", path.name
+    repo = str(payload.get("cwd") or payload.get("workspace") or "")
+    session = str(payload.get("session_id") or payload.get("sessionId") or path.name)
+    return repo, session
+
+
+def coalesce(paths: list[Path], limit: int) -> tuple[dict[tuple[Path, str], list[Path]], list[Path]]:
+    """Keep the newest payload per (queue, repo, session), grouped by queue and repo; return it and the superseded files.
+
+    ``paths`` beyond ``limit`` are dropped oldest first, so a backlog can never
+    turn into an afternoon of tuner runs.
+    """
+    dropped = paths[: max(len(paths) - limit, 0)]
+    latest: dict[tuple[Path, str, str], Path] = {}
+    for path in paths[len(dropped):]:
+        key = (path.parent, *session_key(path))
+        if key in latest:
+            dropped.append(latest[key])
+        latest[key] = path
+    by_repo: dict[tuple[Path, str], list[Path]] = {}
+    for (queue, repo, _session), path in latest.items():
+        by_repo.setdefault((queue, repo), []).append(path)
+    return by_repo, dropped
+
+
+def client_of(path: Path) -> str:
+    parts = path.name.split(".")
+    return parts[1] if len(parts) >= 4 else "unknown"
+
+
+def queue_worker(queue: Path) -> Path | None:
+    try:
+        worker = Path((queue / "worker").read_text().strip())
+    except OSError:
+        return None
+    return worker if worker.is_file() else None
+
+
+def run_tuner(command: list[str], cwd: str | None, timeout_s: float) -> str:
+    """Run one tuner in its own process group; on timeout the whole group goes."""
+    try:
+        proc = subprocess.Popen(command, cwd=cwd, stdin=subprocess.DEVNULL, start_new_session=True)
+    except OSError as exc:
+        return f"failed: {exc}"
+    try:
+        return f"exit {proc.wait(timeout=timeout_s)}"
+    except subprocess.TimeoutExpired:
+        for sig, grace in ((signal.SIGTERM, 5), (signal.SIGKILL, None)):
+            try:
+                os.killpg(proc.pid, sig)
+                proc.wait(timeout=grace)
+                break
+            except ProcessLookupError:
+                break
+            except subprocess.TimeoutExpired:
+                continue
+        return f"timed out after {timeout_s:.0f}s"
+
+
+def run_batch(args: argparse.Namespace) -> None:
+    by_repo, dropped = coalesce(pending(args.spool), args.max_pending)
+    for path in dropped:
+        path.unlink(missing_ok=True)
+    if dropped:
+        log(f"coalesced away {len(dropped)} superseded or overflow payload(s)")
+    for (queue, repo), paths in by_repo.items():
+        worker = queue_worker(queue)
+        for path in paths:
+            started = time.monotonic()
+            if worker is None:
+                status = f"skipped: no worker recorded in {queue}"
+            else:
+                status = run_tuner(
+                    [sys.executable, str(worker), "--client", client_of(path), "--input", str(path)],
+                    repo if repo and Path(repo).is_dir() else None,
+                    args.run_timeout,
+                )
+            log(f"{repo or '-'} {path.name}: {status} in {time.monotonic() - started:.1f}s")
+            path.unlink(missing_ok=True)
+
+
+def acquire(lock_fd: int | None, lock_path: Path) -> int | None:
+    """Take the drain lock without blocking; the hook may already hold it for us."""
+    fd = lock_fd if lock_fd is not None else os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        if lock_fd is None:
+            os.close(fd)
+        return None
+    return fd
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--spool", type=Path, required=True, help="spool root holding one queue per worker")
+    parser.add_argument("--lock-fd", type=int, help="descriptor of drain.lock, already locked by the hook")
+    parser.add_argument("--debounce", type=float, default=float(os.environ.get("GOD_MERGE_FORWARD_DEBOUNCE_S", "30")))
+    parser.add_argument("--max-wait", type=float, default=float(os.environ.get("GOD_MERGE_FORWARD_DEBOUNCE_MAX_S", "300")))
+    parser.add_argument("--max-pending", type=int, default=int(os.environ.get("GOD_MERGE_FORWARD_SPOOL_MAX", "64")))
+    parser.add_argument(
+        "--run-timeout",
+        type=float,
+        default=float(os.environ.get("GOD_MERGE_FORWARD_REBALANCE_TIMEOUT", "900")),
+        help="seconds each tuner run may take",
+    )
+    args = parser.parse_args()
+
+    lock_path = args.spool.parent / "drain.lock"
+    fd = acquire(args.lock_fd, lock_path)
+    if fd is None:
+        return 0
+    while True:
+        debounce(args.spool, args.debounce, args.max_wait)
+        run_batch(args)
+        if pending(args.spool):
+            continue
+        # Release, then look again: a hook that spooled after the last scan saw
+        # the lock held and left its payload for us.
+        fcntl.flock(fd, fcntl.LOCK_UN)
+        if not pending(args.spool) or acquire(fd, lock_path) is None:
+            return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,5 @@
 #!/usr/bin/env bash
-# Fast session-end entrypoint. Capture stdin and detach the real skill tuner.
+# Fast session-end entrypoint. Spool stdin and wake the single-flight drain worker.
 # Always exit successfully and never hold up agent shutdown.
 set -uo pipefail
 
@@ -19,15 +19,39 @@ REPO_ROOT="$(cd "${HOOK_DIR}/../../.." && pwd)"
 WORKER="${REPO_ROOT}/skills/33god-merge-forward/scripts/rebalance.py"
 [[ -f "$WORKER" ]] || { cat >/dev/null 2>&1 || true; exit 0; }
 
-INPUT_TMP="$(mktemp -t 33god-merge-forward-session.XXXXXX 2>/dev/null)" || exit 0
-cat >"$INPUT_TMP" 2>/dev/null || printf '{}\n' >"$INPUT_TMP"
-
 STATE_DIR="${XDG_STATE_HOME:-${HOME}/.local/state}/33god-merge-forward"
-mkdir -p "$STATE_DIR" 2>/dev/null || true
+# One queue per worker: checkouts and per-repo extensions share the drain but
+# each payload is tuned by the rebalance.py whose hook spooled it.
+QUEUE_KEY="$(printf '%s' "$WORKER" | cksum)"
+QUEUE="${STATE_DIR}/spool/${QUEUE_KEY%% *}"
+mkdir -p "$QUEUE" 2>/dev/null || { cat >/dev/null 2>&1 || true; exit 0; }
+if [[ "$(cat "${QUEUE}/worker" 2>/dev/null)" != "$WORKER" ]]; then
+  printf '%s\n' "$WORKER" >"${QUEUE}/.worker.$$" && mv -f "${QUEUE}/.worker.$$" "${QUEUE}/worker"
+fi
+
+# Write under a dot name, then rename: the worker only ever sees whole payloads.
+# EPOCHREALTIME's separator follows the locale (`.` or `,`); keep digits only.
+STAMP="${EPOCHREALTIME:-}"
+STAMP="${STAMP//[!0-9]/}000"
+[[ "$STAMP" == 000 ]] && STAMP="$(date +%s%N)"
+INCOMING="${QUEUE}/.incoming.$$"
+cat >"$INCOMING" 2>/dev/null || printf '{}\n' >"$INCOMING"
+mv -f "$INCOMING" "${QUEUE}/${STAMP}.${CLIENT//[^A-Za-z0-9_-]/_}.$$.json" 2>/dev/null || exit 0
+
+# Single flight: whoever takes the lock starts the worker and hands it the
+# descriptor. A busy lock means a worker is already debouncing and will pick
+# this payload up before it exits.
+if command -v flock >/dev/null 2>&1; then
+  exec 9>>"${STATE_DIR}/drain.lock" || exit 0
+  flock -n 9 || exit 0
+  LOCK_ARGS=(--lock-fd 9)
+else
+  LOCK_ARGS=()
+fi
 
+# drain.py bounds each tuner run by GOD_MERGE_FORWARD_REBALANCE_TIMEOUT itself.
 GOD_MERGE_FORWARD_REBALANCE=1 \
-  setsid nohup timeout "${GOD_MERGE_FORWARD_REBALANCE_TIMEOUT:-900}" \
-  python3 "$WORKER" --client "$CLIENT" --input "$INPUT_TMP" \
+  setsid nohup python3 "${HOOK_DIR}/drain.py" --spool "${STATE_DIR}/spool" "${LOCK_ARGS[@]}" \
   </dev/null >>"${STATE_DIR}/launcher.log" 2>&1 &
 disown 2>/dev/null || true
 
@@ -3,16 +3,26 @@
 from __future__ import annotations
 
 import argparse
+import glob
+import hashlib
 import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
 HOOK_DIR = Path(__file__).resolve().parent
 REPO_ROOT = HOOK_DIR.parent.parent
 MASTER = HOOK_DIR / "hooks.master.json"
+LOCAL_CONFIG = REPO_ROOT / ".agents" / "local.json"
+# Every projected command runs this, relative to its master's hook dir.
+HOOK_WRAPPER = "lib/hook-guard.sh"
+STATE_DIR = Path(os.environ.get("XDG_STATE_HOME") or Path.home() / ".local" / "state") / "33god-hooks"
+STATE_VERSION = 1
+DEFAULT_LATENCY_BUDGET = 0.5
+AGENTS = ("claude", "codex", "kimi", "hermes")
 QUIET = False
 
 
@@ -25,19 +35,31 @@ def warn(message: str) -> None:
     print(f"[33god-hooks] {message}", file=sys.stderr)
 
 
-def load_master() -> dict:
-    return json.loads(MASTER.read_text())
+def load_master(path: Path = MASTER, repo: Path = REPO_ROOT) -> dict:
+    """Load a hook master and remember which repo and hook directory it projects."""
+    master = json.loads(path.read_text())
+    master["_path"] = str(path)
+    master["_repo"] = str(repo)
+    master["_hook_dir"] = str(path.parent)
+    return master
+
+
+def repo_root(master: dict) -> Path:
+    return Path(master.get("_repo", REPO_ROOT))
+
+
+def hook_dir(master: dict) -> Path:
+    return Path(master.get("_hook_dir", HOOK_DIR))
 
 
 def load_disabled_agents() -> set[str]:
     disabled: set[str] = set()
-    path = REPO_ROOT / ".agents" / "local.json"
-    if path.exists():
+    if LOCAL_CONFIG.exists():
         try:
-            disabled.update((json.loads(path.read_text()).get("hooks") or {}).get("disabled_agents") or [])
+            disabled.update((json.loads(LOCAL_CONFIG.read_text()).get("hooks") or {}).get("disabled_agents") or [])
         except (OSError, json.JSONDecodeError) as exc:
             warn(f"ignoring malformed .agents/local.json: {exc}")
-    for name in ("claude", "codex", "kimi", "hermes"):
+    for name in AGENTS:
         if os.environ.get(f"GOD_HOOKS_SKIP_{name.upper()}") == "1":
             disabled.add(name)
     return disabled
@@ -45,9 +67,9 @@ def load_disabled_agents() -> set[str]:
 
 def agent_command(master: dict, agent_key: str, hook: dict) -> str:
     agent = master["agents"][agent_key]
-    base = agent["base_dir"].replace("{repo}", str(REPO_ROOT))
+    base = agent["base_dir"].replace("{repo}", str(repo_root(master)))
     return (
-        f"{base}/lib/hook-guard.sh {hook['id']} "
+        f"{base}/{HOOK_WRAPPER} {hook['id']} "
         f"{base}/{hook['script']} --client {agent_key}"
     )
 
@@ -76,6 +98,10 @@ def desired_commands(master: dict, agent_key: str) -> list[tuple[str, str | None
     return result
 
 
+def wanted_commands(masters: list[dict], agent_key: str) -> list[str]:
+    return sorted(item[2]["command"] for master in masters for item in desired_commands(master, agent_key))
+
+
 def event_groups(master: dict, agent_key: str) -> dict[str, list[dict]]:
     buckets: dict[tuple[str, str | None], list[dict]] = {}
     order: list[tuple[str, str | None]] = []
@@ -98,9 +124,26 @@ def hook_marker() -> str:
     return "/.agents/hooks/merge-forward/session-end.sh"
 
 
-def strip_marked(hooks: dict) -> bool:
+def hook_markers(masters: list[dict]) -> tuple[str, ...]:
+    """Command substrings that identify hooks these masters own in a client config.
+
+    This repo keeps its fixed marker so stale copies are reaped even after a
+    hook leaves the master; component masters own `/<hook dir>/<script>`.
+    """
+    markers = {hook_marker()}
+    for master in masters:
+        base = hook_dir(master).relative_to(repo_root(master)).as_posix()
+        markers.update(f"/{base}/{hook['script']}" for hook in master["hooks"])
+    return tuple(sorted(markers))
+
+
+def owned(command: object, markers: tuple[str, ...]) -> bool:
+    text = str(command)
+    return any(marker in text for marker in markers)
+
+
+def strip_marked(hooks: dict, markers: tuple[str, ...]) -> bool:
     changed = False
-    marker = hook_marker()
     for event, groups in list(hooks.items()):
         if not isinstance(groups, list):
             warn(f"preserving non-list foreign hook group for {event}")
@@ -111,7 +154,7 @@ def strip_marked(hooks: dict) -> bool:
                 new_groups.append(group)
                 continue
             commands = group.get("hooks", []) if isinstance(group, dict) else []
-            kept = [item for item in commands if marker not in str(item.get("command", ""))]
+            kept = [item for item in commands if not owned(item.get("command", ""), markers)]
             if len(kept) != len(commands):
                 changed = True
             if kept:
@@ -131,73 +174,77 @@ def strip_marked(hooks: dict) -> bool:
 def json_target(master: dict, agent_key: str) -> Path:
     raw = master["agents"][agent_key]["config_target"]
     path = Path(os.path.expanduser(raw))
-    return path if path.is_absolute() else REPO_ROOT / path
+    return path if path.is_absolute() else repo_root(master) / path
 
 
-def load_json_target(path: Path) -> dict | None:
+def load_json_target(path: Path) -> tuple[dict | None, str]:
+    """Parse a JSON client config, returning the data and the text it was read from."""
     if not path.exists():
-        return {"hooks": {}}
+        return {"hooks": {}}, ""
+    original = path.read_text()
     try:
-        data = json.loads(path.read_text() or "{}")
+        data = json.loads(original or "{}")
     except json.JSONDecodeError as exc:
         warn(f"refusing to modify invalid JSON at {path}: {exc}")
-        return None
+        return None, original
     if not isinstance(data, dict):
         warn(f"refusing to modify non-object JSON at {path}")
-        return None
-    return data
+        return None, original
+    return data, original
 
 
-def backup_once(path: Path) -> None:
+def backup_once(path: Path, original: str | None = None) -> None:
     backup = path.with_suffix(path.suffix + ".33god-bak")
     if path.exists() and not backup.exists():
-        backup.write_text(path.read_text())
+        backup.write_text(path.read_text() if original is None else original)
 
 
-def install_json(master: dict, agent_key: str) -> None:
-    path = json_target(master, agent_key)
+def install_json(masters: list[dict], agent_key: str) -> None:
+    path = json_target(masters[0], agent_key)
     if agent_key == "codex" and not path.parent.exists():
         log("codex: config home absent, skipping")
         return
-    data = load_json_target(path)
+    data, original = load_json_target(path)
     if data is None:
         return
     hooks = data.setdefault("hooks", {})
     if not isinstance(hooks, dict):
         warn(f"refusing to replace non-object hooks key in {path}")
         return
-    strip_marked(hooks)
-    for event, groups in event_groups(master, agent_key).items():
-        hooks.setdefault(event, []).extend(groups)
+    strip_marked(hooks, hook_markers(masters))
+    for master in masters:
+        for event, groups in event_groups(master, agent_key).items():
+            hooks.setdefault(event, []).extend(groups)
     serialized = json.dumps(data, indent=2) + "\n"
-    if path.exists() and path.read_text() == serialized:
+    if path.exists() and original == serialized:
         log(f"{agent_key}: up to date")
         return
     path.parent.mkdir(parents=True, exist_ok=True)
-    backup_once(path)
+    backup_once(path, original)
     path.write_text(serialized)
     log(f"{agent_key}: installed into {path}")
 
 
-def uninstall_json(master: dict, agent_key: str) -> None:
-    path = json_target(master, agent_key)
-    data = load_json_target(path) if path.exists() else None
+def uninstall_json(masters: list[dict], agent_key: str) -> None:
+    path = json_target(masters[0], agent_key)
+    data, _ = load_json_target(path) if path.exists() else (None, "")
     if data is None:
         return
     hooks = data.get("hooks")
-    if isinstance(hooks, dict) and strip_marked(hooks):
+    if isinstance(hooks, dict) and strip_marked(hooks, hook_markers(masters)):
         path.write_text(json.dumps(data, indent=2) + "\n")
         log(f"{agent_key}: uninstalled from {path}")
 
 
-def check_json(master: dict, agent_key: str) -> bool:
-    path = json_target(master, agent_key)
+def check_json(masters: list[dict], agent_key: str) -> bool:
+    path = json_target(masters[0], agent_key)
     if not path.exists():
         warn(f"DRIFT: {agent_key} target missing: {path}")
         return False
-    data = load_json_target(path)
+    data, _ = load_json_target(path)
     if data is None:
         return False
+    markers = hook_markers(masters)
     actual = sorted(
         item.get("command", "")
         for groups in (data.get("hooks") or {}).values()
@@ -206,10 +253,9 @@ def check_json(master: dict, agent_key: str) -> bool:
         if isinstance(group, dict)
         for item in group.get("hooks", [])
         if isinstance(item, dict)
-        if hook_marker() in item.get("command", "")
+        if owned(item.get("command", ""), markers)
     )
-    wanted = sorted(item[2]["command"] for item in desired_commands(master, agent_key))
-    if actual != wanted:
+    if actual != wanted_commands(masters, agent_key):
         warn(f"DRIFT: {agent_key} hook projection differs from hooks.master.json")
         return False
     log(f"{agent_key}: in sync")
@@ -222,8 +268,15 @@ def kimi_target(master: dict) -> Path:
     return Path(configured_home) / "config.toml" if configured_home else Path(os.path.expanduser(agent["config_target"]))
 
 
-def kimi_markers(master: dict) -> tuple[str, str]:
-    label = f"{master['marker']} ({REPO_ROOT.name})"
+def kimi_markers(master: dict, label: str | None = None) -> tuple[str, str]:
+    """BEGIN/END lines naming the master file, so no two masters share a block.
+
+    The label is the repo root plus the master's path within it: two masters
+    in one repo, or two checkouts with the same directory name, differ.
+    """
+    if label is None:
+        relative = Path(master.get("_path", MASTER)).relative_to(repo_root(master)).as_posix()
+        label = f"{master['marker']} ({repo_root(master)}/{relative})"
     return f"# >>> {label} BEGIN", f"# <<< {label} END"
 
 
@@ -243,6 +296,20 @@ def strip_kimi(text: str, master: dict) -> tuple[str, bool]:
     begin, end = kimi_markers(master)
     pattern = re.compile(r"\n?" + re.escape(begin) + r".*?" + re.escape(end) + r"\n?", re.DOTALL)
     updated, count = pattern.subn("", text)
+    # Older blocks were labelled by repo directory name alone, which other
+    # checkouts share: take one over only when it runs this master's hooks.
+    begin, end = kimi_markers(master, f"{master['marker']} ({repo_root(master).name})")
+    legacy = re.compile(r"\n?" + re.escape(begin) + r".*?" + re.escape(end) + r"\n?", re.DOTALL)
+    owner = f"{hook_dir(master).as_posix()}/"
+
+    def drop(match: re.Match[str]) -> str:
+        nonlocal count
+        if owner not in match.group(0):
+            return match.group(0)
+        count += 1
+        return ""
+
+    updated = legacy.sub(drop, updated)
     return updated, count > 0
 
 
@@ -251,39 +318,59 @@ def strip_kimi(text: str, master: dict) -> tuple[str, bool]:
 # `.` would cross newlines and the first match would swallow the rest of the
 # file, taking every unrelated hook and section with it.
 KIMI_HOOK_SECTION = re.compile(r"(?m)^\[\[hooks\]\][ \t]*\n(?:(?!\[).*\n?)*")
+# Any BEGIN/END marker block, ours or another master's.
+KIMI_BLOCK = re.compile(r"(?ms)^# >>> (?P<label>[^\n]*) BEGIN$.*?^# <<< (?P=label) END$\n?")
+
+
+def kimi_outside_foreign(text: str, masters: list[dict]) -> list[tuple[str, bool]]:
+    """Split the config into (chunk, foreign) runs, where foreign chunks are
+    marker blocks written by masters other than ``masters`` (other checkouts
+    share this config) and must be left as they are."""
+    ours = {kimi_markers(master)[0] for master in masters}
+    chunks, last = [], 0
+    for match in KIMI_BLOCK.finditer(text):
+        if f"# >>> {match['label']} BEGIN" in ours:
+            continue
+        chunks.extend([(text[last:match.start()], False), (match.group(0), True)])
+        last = match.end()
+    chunks.append((text[last:], False))
+    return chunks
 
 
-def strip_kimi_orphans(text: str, master: dict) -> tuple[str, int]:
-    """Drop [[hooks]] entries we own that live OUTSIDE the marker block.
+def strip_kimi_orphans(text: str, masters: list[dict]) -> tuple[str, int]:
+    """Drop [[hooks]] entries we own that live OUTSIDE any marker block.
 
     Every earlier fan-out that ran before the marker block existed (or under a
     different repo-name marker) left a full copy behind. Because the old check
     only asked whether the marker block was present as a substring, those
     copies were invisible and the hook fired once per stray copy per session.
     """
-    marker = hook_marker()
+    markers = hook_markers(masters)
     removed = 0
 
     def drop(match: re.Match[str]) -> str:
         nonlocal removed
-        if marker in match.group(0):
+        if owned(match.group(0), markers):
             removed += 1
             return ""
         return match.group(0)
 
-    return KIMI_HOOK_SECTION.sub(drop, text), removed
+    updated = "".join(
+        chunk if foreign else KIMI_HOOK_SECTION.sub(drop, chunk)
+        for chunk, foreign in kimi_outside_foreign(text, masters)
+    )
+    return updated, removed
 
 
-def kimi_owned_commands(text: str) -> list[str]:
+def kimi_owned_commands(text: str, markers: tuple[str, ...]) -> list[str]:
     """Every command in the file that this fan-out owns, block or not."""
-    marker = hook_marker()
     try:
         import tomllib
     except ModuleNotFoundError:  # pragma: no cover - py<3.11
         return [
             line.split("=", 1)[1].strip().strip('"').strip("'")
             for line in text.splitlines()
-            if line.strip().startswith("command") and marker in line
+            if line.strip().startswith("command") and owned(line, markers)
         ]
     try:
         data = tomllib.loads(text)
@@ -292,7 +379,7 @@ def kimi_owned_commands(text: str) -> list[str]:
         return [
             line.split("=", 1)[1].strip().strip('"').strip("'")
             for line in text.splitlines()
-            if line.strip().startswith("command") and marker in line
+            if line.strip().startswith("command") and owned(line, markers)
         ]
     hooks = data.get("hooks")
     if not isinstance(hooks, list):
@@ -300,42 +387,47 @@ def kimi_owned_commands(text: str) -> list[str]:
     return [
         entry["command"]
         for entry in hooks
-        if isinstance(entry, dict) and marker in str(entry.get("command", ""))
+        if isinstance(entry, dict) and owned(entry.get("command", ""), markers)
     ]
 
 
-def install_kimi(master: dict) -> None:
-    path = kimi_target(master)
+def install_kimi(masters: list[dict], agent_key: str = "kimi") -> None:
+    path = kimi_target(masters[0])
     if not path.parent.exists():
         log("kimi: config home absent, skipping")
         return
     original = path.read_text() if path.exists() else ""
-    body, _ = strip_kimi(original, master)
-    body, orphans = strip_kimi_orphans(body, master)
+    body = original
+    for master in masters:
+        body, _ = strip_kimi(body, master)
+    body, orphans = strip_kimi_orphans(body, masters)
     body = re.sub(r"(?m)^\s*hooks\s*=\s*\[\s*\]\s*\n?", "", body).rstrip("\n")
-    updated = (body + "\n\n" if body else "") + kimi_block(master)
+    updated = (body + "\n\n" if body else "") + "\n".join(kimi_block(master) for master in masters)
     if updated == original:
         log("kimi: up to date")
         return
-    backup_once(path)
+    backup_once(path, original)
     path.write_text(updated)
     if orphans:
         log(f"kimi: reaped {orphans} orphaned copy(ies) of our hook outside the marker block")
     log(f"kimi: installed into {path}")
 
 
-def uninstall_kimi(master: dict) -> None:
-    path = kimi_target(master)
+def uninstall_kimi(masters: list[dict], agent_key: str = "kimi") -> None:
+    path = kimi_target(masters[0])
     if not path.exists():
         return
-    updated, changed = strip_kimi(path.read_text(), master)
+    updated, changed = path.read_text(), False
+    for master in masters:
+        updated, stripped = strip_kimi(updated, master)
+        changed |= stripped
     if changed:
         path.write_text(updated.rstrip("\n") + ("\n" if updated.strip() else ""))
         log(f"kimi: uninstalled from {path}")
 
 
-def check_kimi(master: dict) -> bool:
-    path = kimi_target(master)
+def check_kimi(masters: list[dict], agent_key: str = "kimi") -> bool:
+    path = kimi_target(masters[0])
     if not path.exists():
         # Match check_json: a configured client whose config is gone is drift,
         # not a pass. Only an absent config HOME means "this client isn't here".
@@ -348,8 +440,9 @@ def check_kimi(master: dict) -> bool:
     # Compare the FULL SET of commands we own, not just "is the block present".
     # A substring test passes while stray copies of the same hook sit outside
     # the block, silently multiplying how often it fires.
-    actual = sorted(kimi_owned_commands(text))
-    wanted = sorted(item[2]["command"] for item in desired_commands(master, "kimi"))
+    ours = "".join(chunk for chunk, foreign in kimi_outside_foreign(text, masters) if not foreign)
+    actual = sorted(kimi_owned_commands(ours, hook_markers(masters)))
+    wanted = wanted_commands(masters, "kimi")
     if actual != wanted:
         extra = len(actual) - len(wanted)
         if extra > 0 and set(actual) == set(wanted):
@@ -357,7 +450,7 @@ def check_kimi(master: dict) -> bool:
         else:
             warn("DRIFT: kimi hook projection differs from hooks.master.json")
         return False
-    if kimi_block(master).strip() not in text:
+    if any(kimi_block(master).strip() not in text for master in masters):
         warn("DRIFT: kimi hooks are present but not inside the managed marker block")
         return False
     log("kimi: in sync")
@@ -366,66 +459,65 @@ def check_kimi(master: dict) -> bool:
 
 def hermes_paths(master: dict) -> tuple[Path, Path]:
     agent = master["agents"]["hermes"]
-    return REPO_ROOT / agent["config_target"], REPO_ROOT / agent["allowlist_target"]
+    return repo_root(master) / agent["config_target"], repo_root(master) / agent["allowlist_target"]
 
 
-def install_hermes(master: dict) -> None:
-    config, allowlist = hermes_paths(master)
+def install_hermes(masters: list[dict], agent_key: str = "hermes") -> None:
+    config, allowlist = hermes_paths(masters[0])
     if not config.exists():
         log("hermes: local runtime absent, skipping")
         return
     try:
         import yaml
-        data = yaml.safe_load(config.read_text()) or {}
+        original_config = config.read_text()
+        data = yaml.safe_load(original_config) or {}
     except Exception as exc:  # noqa: BLE001
         warn(f"hermes: cannot load runtime config: {exc}")
         return
-    original_config = config.read_text()
     hooks = data.setdefault("hooks", {})
-    marker = hook_marker()
+    markers = hook_markers(masters)
     for event, entries in list(hooks.items()):
-        hooks[event] = [entry for entry in entries if marker not in str(entry.get("command", ""))]
+        hooks[event] = [entry for entry in entries if not owned(entry.get("command", ""), markers)]
         if not hooks[event]:
             hooks.pop(event)
-    commands = desired_commands(master, "hermes")
+    commands = [item for master in masters for item in desired_commands(master, "hermes")]
     for event, _matcher, item in commands:
         hooks.setdefault(event, []).append({"command": item["command"], "timeout": item["timeout"]})
     serialized_config = yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
     if serialized_config != original_config:
-        backup_once(config)
+        backup_once(config, original_config)
         config.write_text(serialized_config)
 
-    approvals = {"approvals": []}
-    if allowlist.exists():
-        try:
-            approvals = json.loads(allowlist.read_text() or '{"approvals": []}')
-        except json.JSONDecodeError:
-            pass
     original_allowlist = allowlist.read_text() if allowlist.exists() else ""
+    approvals = {"approvals": []}
+    try:
+        approvals = json.loads(original_allowlist or '{"approvals": []}')
+    except json.JSONDecodeError:
+        pass
     existing = approvals.setdefault("approvals", [])
     ours = {
         (entry.get("event"), entry.get("command")): entry
         for entry in existing
-        if marker in str(entry.get("command", ""))
+        if owned(entry.get("command", ""), markers)
     }
-    current = [entry for entry in existing if marker not in str(entry.get("command", ""))]
+    current = [entry for entry in existing if not owned(entry.get("command", ""), markers)]
     now = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     for event, _matcher, item in commands:
         current.append(
             ours.get((event, item["command"]))
-            or {"approved_at": now, "approved_by": master["marker"], "command": item["command"], "event": event}
+            or {"approved_at": now, "approved_by": masters[0]["marker"], "command": item["command"], "event": event}
         )
     approvals["approvals"] = current
     serialized_allowlist = json.dumps(approvals, indent=2) + "\n"
     if serialized_allowlist != original_allowlist:
-        backup_once(allowlist)
+        backup_once(allowlist, original_allowlist)
         allowlist.write_text(serialized_allowlist)
     log("hermes: up to date" if serialized_config == original_config and serialized_allowlist == original_allowlist else "hermes: installed into local runtime")
 
 
-def uninstall_hermes(master: dict) -> None:
-    config, allowlist = hermes_paths(master)
-    marker = hook_marker()
+def uninstall_hermes(masters: list[dict], agent_key: str = "hermes") -> None:
+    config, allowlist = hermes_paths(masters[0])
+    markers = hook_markers(masters)
     try:
         import yaml
     except ImportError:
@@ -435,7 +527,7 @@ def uninstall_hermes(master: dict) -> None:
         hooks = data.get("hooks") or {}
         changed = False
         for event, entries in list(hooks.items()):
-            kept = [entry for entry in entries if marker not in str(entry.get("command", ""))]
+            kept = [entry for entry in entries if not owned(entry.get("command", ""), markers)]
             changed |= len(kept) != len(entries)
             if kept:
                 hooks[event] = kept
@@ -445,15 +537,15 @@ def uninstall_hermes(master: dict) -> None:
             config.write_text(yaml.safe_dump(data, sort_keys=False, allow_unicode=True))
     if allowlist.exists():
         data = json.loads(allowlist.read_text() or '{"approvals": []}')
-        kept = [entry for entry in data.get("approvals", []) if marker not in str(entry.get("command", ""))]
+        kept = [entry for entry in data.get("approvals", []) if not owned(entry.get("command", ""), markers)]
         if len(kept) != len(data.get("approvals", [])):
             data["approvals"] = kept
             allowlist.write_text(json.dumps(data, indent=2) + "\n")
     log("hermes: uninstalled from local runtime")
 
 
-def check_hermes(master: dict) -> bool:
-    config, allowlist = hermes_paths(master)
+def check_hermes(masters: list[dict], agent_key: str = "hermes") -> bool:
+    config, allowlist = hermes_paths(masters[0])
     if not config.exists():
         return True
     try:
@@ -475,7 +567,7 @@ def check_hermes(master: dict) -> bool:
         for entry in allowlist_data.get("approvals", [])
         if isinstance(entry, dict)
     }
-    wanted = [item[2]["command"] for item in desired_commands(master, "hermes")]
+    wanted = wanted_commands(masters, "hermes")
     missing = [command for command in wanted if command not in config_commands or command not in approved_commands]
     if missing:
         warn(f"DRIFT: hermes runtime missing {len(missing)} hook projection(s)")
@@ -484,16 +576,74 @@ def check_hermes(master: dict) -> bool:
     return True
 
 
+def bench_path(repo: Path) -> Path:
+    digest = hashlib.sha256(str(repo).encode()).hexdigest()[:16]
+    return STATE_DIR / f"bench-{digest}.json"
+
+
+def load_bench(master: dict) -> dict:
+    """Latency percentiles recorded by bench.py, keyed by hook id then agent."""
+    try:
+        data = json.loads(bench_path(repo_root(master)).read_text())
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return data.get("hooks", {}) if isinstance(data, dict) and data.get("version") == STATE_VERSION else {}
+
+
+def latency_budget_ms(master: dict, hook: dict) -> float:
+    fraction = hook.get("latency_budget_fraction", master.get("latency_budget_fraction", DEFAULT_LATENCY_BUDGET))
+    return float(fraction) * hook["timeout_s"] * 1000
+
+
+def check_latency(master: dict, agents: list[str]) -> bool:
+    """Fail when a benchmarked hook's p95 eats more than its share of the client timeout.
+
+    Only measurements of the command currently projected count; a hook that was
+    never benchmarked, or whose command changed since, is not judged.
+    """
+    results = load_bench(master)
+    ok = True
+    for hook in master["hooks"]:
+        budget = latency_budget_ms(master, hook)
+        for agent, stats in (results.get(hook["id"]) or {}).items():
+            if agent not in agents or agent not in master["agents"]:
+                continue
+            if stats.get("command") != agent_command(master, agent, hook):
+                continue
+            if stats.get("p95", 0) > budget:
+                warn(
+                    f"LATENCY: {hook['id']} via {agent} p95 {stats['p95']:.0f}ms exceeds "
+                    f"{budget:.0f}ms budget of its {hook['timeout_s']}s timeout (rerun .agents/hooks/bench.py after fixing)"
+                )
+                ok = False
+    return ok
+
+
+INSTALLERS = {"claude": install_json, "codex": install_json, "kimi": install_kimi, "hermes": install_hermes}
+UNINSTALLERS = {"codex": uninstall_json, "kimi": uninstall_kimi, "hermes": uninstall_hermes}
+CHECKERS = {"claude": check_json, "codex": check_json, "kimi": check_kimi, "hermes": check_hermes}
+
+
 def check_hook_scripts(master: dict) -> bool:
     """Verify each hook actually points at something runnable.
 
     Every per-client check below compares wiring text to wiring text, so all
     four can report "in sync" while the single script they all invoke does not
-    exist on disk. Validate the target before trusting the projection.
+    exist on disk. Validate the target before trusting the projection, and the
+    wrapper in front of it: component masters project this repo's layout but
+    ship their own lib/.
     """
     ok = True
+    entry = hook_dir(master) / HOOK_WRAPPER
+    if master["hooks"] and not entry.exists():
+        warn(f"DRIFT: hook wrapper missing: {entry}")
+        warn("       every projected command runs it — add it to that repo's hook dir or drop its hooks")
+        ok = False
+    elif master["hooks"] and not os.access(entry, os.X_OK):
+        warn(f"DRIFT: hook wrapper not executable: {entry}")
+        ok = False
     for hook in master["hooks"]:
-        script = HOOK_DIR / hook["script"]
+        script = hook_dir(master) / hook["script"]
         if not script.exists():
             warn(f"DRIFT: hook script missing: {script} (hook id: {hook['id']})")
             warn("       every client's projection points at it — restore the script or drop the hook from hooks.master.json")
@@ -504,8 +654,229 @@ def check_hook_scripts(master: dict) -> bool:
     return ok
 
 
+def stat_fingerprint(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_mode]
+
+
+def agent_targets(master: dict, agent_key: str) -> list[Path]:
+    if agent_key in {"claude", "codex"}:
+        return [json_target(master, agent_key)]
+    if agent_key == "kimi":
+        return [kimi_target(master)]
+    return list(hermes_paths(master))
+
+
+def projection_hash(master: dict, agent_key: str) -> str:
+    projection = [master["marker"], str(repo_root(master)), desired_commands(master, agent_key)]
+    return hashlib.sha256(json.dumps(projection, sort_keys=True).encode()).hexdigest()
+
+
+class SyncState:
+    """Fingerprints from the last successful --check, so an unchanged check is O(stat).
+
+    The context covers the master, .agents/local.json, the hook scripts, and the
+    environment that selects targets or disables agents. Each verified agent
+    records its projection hash, the stat of every target it owns (plus
+    whether the target's config home existed), and the context it was verified
+    under. Any mismatch falls back to the full parse; only a passing check
+    writes the state, and it drops agents not verified under its context.
+    """
+
+    def __init__(self) -> None:
+        digest = hashlib.sha256(str(REPO_ROOT).encode()).hexdigest()[:16]
+        self.path = STATE_DIR / f"sync-{digest}.json"
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, json.JSONDecodeError):
+            data = {}
+        valid = isinstance(data, dict) and data.get("version") == STATE_VERSION
+        self.context = data.get("context") if valid else None
+        self.agents: dict[str, dict] = data.get("agents", {}) if valid else {}
+        self.fresh: set[str] = set()
+
+    @staticmethod
+    def environment() -> dict[str, str]:
+        return {
+            key: value
+            for key, value in sorted(os.environ.items())
+            if key in {"HOME", "KIMI_CODE_HOME"} or key.startswith("GOD_HOOKS_")
+        }
+
+    def current_context(self, scripts: list[str]) -> dict:
+        return {
+            "master": stat_fingerprint(MASTER),
+            "local": stat_fingerprint(LOCAL_CONFIG),
+            "bench": stat_fingerprint(bench_path(REPO_ROOT)),
+            "env": self.environment(),
+            "scripts": [[script, stat_fingerprint(Path(script))] for script in scripts],
+        }
+
+    @staticmethod
+    def target_tokens(paths: list[Path]) -> list[list]:
+        return [[str(path), stat_fingerprint(path), path.parent.is_dir()] for path in paths]
+
+    def targets_unchanged(self, entry: dict) -> bool:
+        return all(
+            stat_fingerprint(Path(path)) == fingerprint and Path(path).parent.is_dir() == parent
+            for path, fingerprint, parent in entry.get("targets", [])
+        )
+
+    def unchanged(self, agents: list[str]) -> bool:
+        """True when nothing the last passing check depended on has changed."""
+        if not self.context:
+            return False
+        scripts = [script for script, _ in self.context.get("scripts", [])]
+        if self.current_context(scripts) != self.context:
+            return False
+        return all(
+            agent in self.agents
+            and self.agents[agent].get("context") == self.context
+            and self.targets_unchanged(self.agents[agent])
+            for agent in agents
+        )
+
+    def agent_unchanged(self, master: dict, agent_key: str) -> bool:
+        """Per-agent shortcut when the master changed but this agent's projection did not."""
+        entry = self.agents.get(agent_key)
+        if not entry or entry.get("silent") or entry.get("projection") != projection_hash(master, agent_key):
+            return False
+        recorded = [path for path, _, _ in entry.get("targets", [])]
+        return recorded == [str(path) for path in agent_targets(master, agent_key)] and self.targets_unchanged(entry)
+
+    def verified(self, master: dict, agent_key: str, *, silent: bool = False) -> None:
+        """Record a passing agent; ``silent`` agents were skipped without output."""
+        self.agents[agent_key] = {
+            "projection": projection_hash(master, agent_key),
+            "targets": self.target_tokens(agent_targets(master, agent_key)),
+            "silent": silent,
+        }
+        self.fresh.add(agent_key)
+
+    def save(self, master: dict) -> None:
+        scripts = [str(hook_dir(master) / hook["script"]) for hook in master["hooks"]]
+        scripts.append(str(hook_dir(master) / HOOK_WRAPPER))
+        context = self.current_context(scripts)
+        agents = {}
+        for agent, entry in self.agents.items():
+            if agent in self.fresh:
+                entry["context"] = context
+            # An agent verified against an older master or environment is stale.
+            if entry.get("context") == context:
+                agents[agent] = entry
+        payload = {
+            "version": STATE_VERSION,
+            "repo": str(REPO_ROOT),
+            "context": context,
+            "agents": agents,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            temporary.write_text(json.dumps(payload, indent=2) + "\n")
+            os.replace(temporary, self.path)
+        except OSError as exc:
+            warn(f"could not record sync state: {exc}")
+
+    def forget(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+PRUNE_DIRS = {".git", "node_modules", ".venv", "venv", "dist", "build", "__pycache__"}
+
+
+def component_repos(spec: str) -> list[Path]:
+    """Resolve --repos to repo directories: a components.yaml registry or a glob."""
+    path = Path(os.path.expanduser(spec))
+    if path.suffix in {".yaml", ".yml"} and path.is_file():
+        import yaml
+
+        registry = yaml.safe_load(path.read_text()) or {}
+        repos = []
+        for name in registry.get("component_files") or []:
+            component = yaml.safe_load((path.parent / name).read_text()) or {}
+            if component.get("repo"):
+                repos.append((path.parent / os.path.expanduser(component["repo"])).resolve())
+        return repos
+    return sorted(Path(match).resolve() for match in glob.glob(os.path.expanduser(spec)) if Path(match).is_dir())
+
+
+def discover_masters(repo: Path) -> list[dict]:
+    """Every hooks.master.json under one repo, skipping vendored and build trees."""
+    if not repo.is_dir():
+        log(f"{repo}: repo absent, skipping")
+        return []
+    masters = []
+    for current, dirs, files in os.walk(repo):
+        dirs[:] = sorted(name for name in dirs if name not in PRUNE_DIRS)
+        if "hooks.master.json" in files:
+            path = Path(current) / "hooks.master.json"
+            try:
+                masters.append(load_master(path, repo))
+            except (OSError, json.JSONDecodeError) as exc:
+                warn(f"ignoring unreadable hook master {path}: {exc}")
+    return masters
+
+
+def load_masters(spec: str | None) -> list[dict]:
+    """This repo's master first, then every component repo's, discovered in parallel."""
+    masters = [load_master()]
+    if spec is None:
+        return masters
+    repos = [repo for repo in dict.fromkeys(component_repos(spec)) if repo != REPO_ROOT]
+    with ThreadPoolExecutor(max_workers=min(8, len(repos) or 1)) as pool:
+        for found in pool.map(discover_masters, repos):
+            masters.extend(found)
+    return masters
+
+
+def agent_target(master: dict, agent_key: str) -> Path:
+    return agent_targets(master, agent_key)[0]
+
+
+def by_target(masters: list[dict], agent_key: str) -> list[list[dict]]:
+    """Group masters projecting into the same client config so it is loaded and written once."""
+    groups: dict[Path, list[dict]] = {}
+    for master in masters:
+        agent = master["agents"].get(agent_key)
+        if agent and agent.get("enabled", True):
+            groups.setdefault(agent_target(master, agent_key), []).append(master)
+    return list(groups.values())
+
+
 def selected(target: str) -> list[str]:
-    return ["claude", "codex", "kimi", "hermes"] if target == "all" else [target]
+    return list(AGENTS) if target == "all" else [target]
+
+
+def run_fanout(args: argparse.Namespace, disabled: set[str]) -> bool:
+    """Install, uninstall, or check every discovered master, one pass per client target."""
+    masters = load_masters(args.repos)
+    ok = True
+    if args.check:
+        with ThreadPoolExecutor(max_workers=min(8, len(masters))) as pool:
+            ok = all(pool.map(check_hook_scripts, masters))
+        ok &= all([check_latency(master, selected(args.target)) for master in masters])
+    def project(agent: str, group: list[dict]) -> bool:
+        if args.check:
+            return agent in disabled or CHECKERS[agent](group, agent)
+        if args.uninstall or agent in disabled:
+            if agent in UNINSTALLERS:
+                UNINSTALLERS[agent](group, agent)
+        else:
+            INSTALLERS[agent](group, agent)
+        return True
+
+    # Each group owns a distinct client config, so groups project in parallel.
+    jobs = [(agent, group) for agent in selected(args.target) for group in by_target(masters, agent)]
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs) or 1)) as pool:
+        ok &= all(list(pool.map(lambda job: project(*job), jobs)))
+    return ok
 
 
 def main() -> int:
@@ -515,31 +886,62 @@ def main() -> int:
     mode.add_argument("--install", action="store_true")
     mode.add_argument("--uninstall", action="store_true")
     mode.add_argument("--check", action="store_true")
-    parser.add_argument("--target", choices=("all", "claude", "codex", "kimi", "hermes"), default="all")
+    parser.add_argument("--target", choices=("all",) + AGENTS, default="all")
+    parser.add_argument(
+        "--repos",
+        metavar="SPEC",
+        help="also project every hooks.master.json found in these repos: a components.yaml registry or a glob of repo dirs",
+    )
     parser.add_argument("--quiet", action="store_true")
     args = parser.parse_args()
     QUIET = args.quiet
 
     try:
-        master = load_master()
         disabled = load_disabled_agents()
+        if args.repos:
+            ok = run_fanout(args, disabled)
+            return 0 if ok else 1
+        state = SyncState() if args.check else None
+        if state is not None and state.unchanged(selected(args.target)):
+            for agent in selected(args.target):
+                if not state.agents[agent].get("silent"):
+                    log(f"{agent}: in sync (unchanged since last check)")
+            return 0
+        master = load_master()
         ok = True
         if args.check:
             ok &= check_hook_scripts(master)
+            ok &= check_latency(master, selected(args.target))
         for agent in selected(args.target):
             if not master["agents"][agent].get("enabled", True):
+                if state is not None:
+                    state.verified(master, agent, silent=True)
                 continue
             if args.check:
                 if agent in disabled:
+                    state.verified(master, agent, silent=True)
+                    continue
+                if state.agent_unchanged(master, agent):
+                    log(f"{agent}: in sync (projection unchanged since last check)")
+                    state.verified(master, agent)
                     continue
-                ok &= {"claude": check_json, "codex": check_json, "kimi": check_kimi, "hermes": check_hermes}[agent](master, agent) if agent in {"claude", "codex"} else {"kimi": check_kimi, "hermes": check_hermes}[agent](master)
+                agent_ok = CHECKERS[agent]([master], agent)
+                if agent_ok:
+                    state.verified(master, agent, silent=agent == "hermes" and not hermes_paths(master)[0].exists())
+                else:
+                    state.agents.pop(agent, None)
+                ok &= agent_ok
                 continue
             if args.uninstall or agent in disabled:
-                if agent == "claude":
-                    continue
-                {"codex": uninstall_json, "kimi": uninstall_kimi, "hermes": uninstall_hermes}[agent](master, agent) if agent == "codex" else {"kimi": uninstall_kimi, "hermes": uninstall_hermes}[agent](master)
+                if agent in UNINSTALLERS:
+                    UNINSTALLERS[agent]([master], agent)
                 continue
-            {"claude": install_json, "codex": install_json, "kimi": install_kimi, "hermes": install_hermes}[agent](master, agent) if agent in {"claude", "codex"} else {"kimi": install_kimi, "hermes": install_hermes}[agent](master)
+            INSTALLERS[agent]([master], agent)
+        if state is not None:
+            if ok:
+                state.save(master)
+            else:
+                state.forget()
         return 0 if ok else 1
     except Exception as exc:  # noqa: BLE001
         warn(f"{type(exc).__name__}: {exc}")
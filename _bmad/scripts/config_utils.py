@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+import tempfile
 import tomllib
 from pathlib import Path
 from typing import Any, Iterable
@@ -12,6 +16,8 @@ class ConfigError(ValueError):
 
 
 _KEYED_MERGE_FIELDS = ("code", "id")
+# Bump whenever structural_merge or layer loading changes what a merge produces.
+MERGE_VERSION = 1
 
 
 def load_toml(path: Path, *, required: bool = False) -> dict[str, Any]:
@@ -95,25 +101,140 @@ def merge_layers(layers: Iterable[dict[str, Any]]) -> dict[str, Any]:
     return merged
 
 
-def load_central_config(project_root: Path) -> dict[str, Any]:
+def central_layer_paths(project_root: Path) -> tuple[Path, ...]:
+    """Central config layers in merge order; only the first is required."""
     bmad_dir = project_root / "_bmad"
-    return merge_layers(
-        (
-            load_toml(bmad_dir / "config.toml", required=True),
-            load_toml(bmad_dir / "config.user.toml"),
-            load_toml(bmad_dir / "custom" / "config.toml"),
-            load_toml(bmad_dir / "custom" / "config.user.toml"),
-        )
+    return (
+        bmad_dir / "config.toml",
+        bmad_dir / "config.user.toml",
+        bmad_dir / "custom" / "config.toml",
+        bmad_dir / "custom" / "config.user.toml",
     )
 
 
-def load_customization(project_root: Path | None, skill_dir: Path) -> dict[str, Any]:
+def customization_layer_paths(
+    project_root: Path | None, skill_dir: Path
+) -> tuple[Path, ...]:
+    """Customization layers in merge order; only the skill default is required."""
     skill_name = skill_dir.name
-    custom_dir = project_root / "_bmad" / "custom" if project_root else None
-    return merge_layers(
-        (
-            load_toml(skill_dir / "customize.toml", required=True),
-            load_toml(custom_dir / f"{skill_name}.toml") if custom_dir else {},
-            load_toml(custom_dir / f"{skill_name}.user.toml") if custom_dir else {},
-        )
+    if project_root is None:
+        return (skill_dir / "customize.toml",)
+    custom_dir = project_root / "_bmad" / "custom"
+    return (
+        skill_dir / "customize.toml",
+        custom_dir / f"{skill_name}.toml",
+        custom_dir / f"{skill_name}.user.toml",
     )
+
+
+def _cache_path(paths: tuple[Path, ...]) -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha256("\0".join(str(path) for path in paths).encode("utf-8")).hexdigest()
+    return Path(base) / "bmad" / "merged-config" / f"{digest[:32]}.json"
+
+
+def _layer_fingerprints(paths: tuple[Path, ...]) -> list[list[Any]]:
+    fingerprints: list[list[Any]] = []
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            fingerprints.append([str(path), None])
+        else:
+            fingerprints.append([str(path), [stat.st_ino, stat.st_size, stat.st_mtime_ns]])
+    return fingerprints
+
+
+def _read_cache(cache_path: Path, fingerprints: list[list[Any]]) -> dict[str, Any] | None:
+    try:
+        cached = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeError, ValueError):
+        return None
+    if (
+        not isinstance(cached, dict)
+        or cached.get("merge_version") != MERGE_VERSION
+        or cached.get("layers") != fingerprints
+        or not isinstance(cached.get("merged"), dict)
+    ):
+        return None
+    return cached["merged"]
+
+
+def _write_cache(
+    cache_path: Path, fingerprints: list[list[Any]], merged: dict[str, Any]
+) -> None:
+    temporary = None
+    try:
+        # TOML dates and times have no JSON form; such merges are simply not cached.
+        payload = json.dumps(
+            {"merge_version": MERGE_VERSION, "layers": fingerprints, "merged": merged},
+            ensure_ascii=False,
+        ).encode("utf-8")
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary = tempfile.mkstemp(prefix=".merged-", dir=cache_path.parent)
+        with os.fdopen(descriptor, "wb") as stream:
+            stream.write(payload)
+        os.replace(temporary, cache_path)
+    except (OSError, TypeError, ValueError):
+        if temporary is not None:
+            Path(temporary).unlink(missing_ok=True)
+
+
+def _load_layers(paths: tuple[Path, ...]) -> dict[str, Any]:
+    """Merge ``paths`` in order, reusing the persisted merge while no layer changed.
+
+    The cache lives under ``$XDG_CACHE_HOME/bmad/merged-config`` and is keyed by
+    every layer's path, inode, size and mtime_ns (absent layers included) plus
+    ``MERGE_VERSION``. Layers are stat'ed before they are read, so an edit racing
+    a merge only ever invalidates the entry. Any cache failure falls back to
+    parsing.
+    """
+    fingerprints = _layer_fingerprints(paths)
+    cache_path = _cache_path(paths)
+    cached = _read_cache(cache_path, fingerprints)
+    if cached is not None:
+        return cached
+    required, *optional = paths
+    merged = merge_layers(
+        (load_toml(required, required=True), *(load_toml(path) for path in optional))
+    )
+    _write_cache(cache_path, fingerprints, merged)
+    return merged
+
+
+def load_central_config(project_root: Path) -> dict[str, Any]:
+    return _load_layers(central_layer_paths(project_root))
+
+
+def load_customization(project_root: Path | None, skill_dir: Path) -> dict[str, Any]:
+    return load_customizations(project_root, (skill_dir,))[skill_dir]
+
+
+def load_customizations(
+    project_root: Path | None, skill_dirs: Iterable[Path]
+) -> dict[Path, dict[str, Any]]:
+    """Customization for several skills, listing the project's ``_bmad/custom`` once.
+
+    Only team and user layers that exist are loaded, so absent ones cost
+    nothing per skill; the merge cache is keyed by the layers actually
+    present, so creating or removing one still invalidates it.
+    """
+    present: set[str] = set()
+    if project_root is not None:
+        try:
+            with os.scandir(project_root / "_bmad" / "custom") as entries:
+                present = {entry.name for entry in entries}
+        except OSError:
+            pass
+    merged: dict[Path, dict[str, Any]] = {}
+    for skill_dir in skill_dirs:
+        required, *optional = customization_layer_paths(project_root, skill_dir)
+        merged[skill_dir] = _load_layers(
+            (required, *(path for path in optional if path.name in present))
+        )
+    return merged
+
+
+def load_skill_defaults(skill_dir: Path) -> dict[str, Any]:
+    """The skill's own customize.toml, through the same cache as the merged layers."""
+    return _load_layers((skill_dir / "customize.toml",))
@@ -20,10 +20,10 @@ Three invariants make it trustworthy:
   1. Append-only, chronological. Entries land at the end, in the order they happen.
      Nothing is ever inserted backward, reordered, edited, or removed. There is no
      edit or delete subcommand by design; history is never rewritten.
-  2. Write-only / blind. Every command is an atomic, context-free write and echoes the
+  2. Write-only / blind. Every write command is atomic and context-free and echoes the
      new state as one line of JSON, so the caller never re-reads the file mid-session.
-     The one time the file is read is on resume — and the caller reads it itself, not
-     via this script.
+     The one time the file is read is on resume — the caller reads it itself, or, for a
+     long log, asks `tail` for just the window it needs.
   3. No lifecycle status. A memory log has no "complete" flag. Whether the work is done,
      blocked, or paused is itself a fact that happened, so it is recorded as an entry
      (e.g. `append --type event --text "session complete"`), never as frontmatter the
@@ -31,8 +31,31 @@ Three invariants make it trustworthy:
      resume learns the state by reading the last entries — the same way it learns
      everything else.
 
-Atomicity: every write goes to a temp file, is flushed and fsync'd, then atomically
-renamed over the target, so a crash never leaves a half-written entry.
+Atomicity: `init`, `set` and the first `append` write a temp file, flush and fsync it,
+then atomically rename it over the target, so a crash never leaves a half-written entry.
+Later appends take the O(1) path: the new line is written with O_APPEND and fsync'd,
+and `updated` (always the last field, fixed width) is overwritten in place. A small
+sidecar (.memlog.md.head) records the committed size, inode, mtime, entry count and the
+offset of `updated`, so an append never re-reads or re-counts the body. If a crash
+leaves bytes past the committed size, whole lines are adopted and a torn partial line
+is truncated away; a sidecar that is missing or describes a different file just sends the
+next write down the full-rewrite path, which rebuilds it.
+
+Index: a second sidecar (.memlog.md.idx) holds one row per entry — byte offset, length,
+timestamp and type — appended alongside every entry, so `tail --n/--since/--type` seeks
+straight to the entries it returns. Entries written before the index existed carry no
+timestamp; a stale or missing index is rebuilt from the file on the next write or tail.
+
+Segments (optional): `init --segment-entries/--segment-bytes` or `segment` sets limits in
+.memlog.d/manifest.json. Once the active file's body passes them it is sealed and new
+entries go to .memlog.d/0001.md, 0002.md, … — each a small memlog of its own with the same
+head, index and O(1) append — while .memlog.md keeps the descriptive frontmatter and its
+`updated`. Nothing ever moves between files, so chronology is manifest order then file
+order; appends only ever touch the active segment, and `cat` streams them all in order.
+
+Concurrency: init, append and set hold an advisory lock on .memlog.md.lock for their
+whole read-modify-write, and every temp file has a unique name, so two agents writing
+the same workspace serialize instead of losing each other's entries.
 
 The file shape (.memlog.md):
 
@@ -61,7 +84,11 @@ for a plain note. The host skill names the vocabulary; the script does not enfor
 Commands:
   init   (--workspace DIR | --path FILE) [--field k=v ...]    create the memlog (errors if it exists)
   append (--workspace DIR | --path FILE) --text STR [--type T] [--by W]  append one entry at the end
+  append (--workspace DIR | --path FILE) --batch < entries.jsonl       append many entries, one write
   set    (--workspace DIR | --path FILE) --key K --value V    set/replace a descriptive frontmatter field
+  tail   (--workspace DIR | --path FILE) [--n N] [--since TS] [--type T,...]  frontmatter + a window of entries
+  cat    (--workspace DIR | --path FILE)                       the whole log, every segment in order
+  segment (--workspace DIR | --path FILE) [--max-entries N] [--max-bytes B]  roll later entries into .memlog.d/
 
 Addressing: `--workspace` is the run folder, and the memlog is always {workspace}/.memlog.md.
 `--path` points straight at the memlog file instead, for callers that already hold the path.
@@ -71,17 +98,34 @@ from __future__ import annotations  # keep type-hint syntax lazy so the script r
 import argparse
 import json
 import os
+import re
+import secrets
+import shutil
 import sys
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no advisory locks here; single writer as before
+    fcntl = None
+
 MEMLOG = ".memlog.md"
+HEAD_SUFFIX = ".head"
+INDEX_SUFFIX = ".idx"
+UPDATED_WIDTH = len("2026-06-07T14:22")
 
 
 def now() -> str:
     return datetime.now().strftime("%Y-%m-%dT%H:%M")
 
 
+def stamp() -> str:
+    """Per-entry time for the index: seconds, so `tail --since` can split a busy minute."""
+    return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
+
+
 def resolve(args) -> Path:
     """The memlog file, from either addressing mode: {workspace}/.memlog.md or an explicit --path."""
     return Path(args.path) if args.path else Path(args.workspace) / MEMLOG
@@ -119,35 +163,331 @@ def touch(meta: dict) -> None:
     meta["updated"] = now()
 
 
+def temp_name(path: Path) -> Path:
+    """A temp file no other writer can be using, beside the target so the rename is atomic."""
+    return path.with_name(f"{path.name}.{os.getpid()}.{secrets.token_hex(4)}.tmp")
+
+
 def write_atomic(path: Path, text: str) -> None:
     """Temp + flush + fsync + atomic rename, so a crash never half-writes an entry."""
-    tmp = path.with_suffix(path.suffix + ".tmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        f.write(text)
-        f.flush()
-        os.fsync(f.fileno())
-    os.replace(tmp, path)
+    tmp = temp_name(path)
+    try:
+        with open(tmp, "x", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def locked(path: Path):
+    """Hold the memlog's advisory write lock for one whole read-modify-write.
+
+    The lock lives on a sidecar (.memlog.md.lock) because a full rewrite renames a new
+    inode over the memlog itself. flock is preferred; lockf covers filesystems (some
+    NFS mounts) that only implement POSIX record locks.
+    """
+    if fcntl is None:
+        yield
+        return
+    fd = os.open(path.with_name(path.name + ".lock"), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        except OSError:
+            fcntl.lockf(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # closing the descriptor releases either kind of lock
 
 
 def entry_count(body: str) -> int:
     return sum(1 for ln in body.splitlines() if ln.startswith("- "))
 
 
-def ack(path: Path, body: str) -> None:
+def head_path(path: Path) -> Path:
+    return path.with_name(path.name + HEAD_SUFFIX)
+
+
+def load_head(path: Path) -> dict | None:
+    try:
+        head = json.loads(head_path(path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return head if isinstance(head, dict) else None
+
+
+def save_head(path: Path, head: dict) -> None:
+    """The sidecar is a cache of the committed state, so it is renamed into place but not
+    fsync'd: losing it only costs one full rewrite, never an entry."""
+    tmp = temp_name(head_path(path))
+    tmp.write_text(json.dumps(head), encoding="utf-8")
+    os.replace(tmp, head_path(path))
+
+
+def index_path(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+def entry_kind(line: str) -> str:
+    """The entry's type from its inline tag: `(idea by user)` -> idea, `(by coach)` -> ''."""
+    match = re.match(r"- \(([^)]*)\) ", line)
+    if not match or match.group(1).startswith("by "):
+        return ""
+    return match.group(1).split(" by ", 1)[0]
+
+
+def index_row(offset: int, length: int, when: str, kind: str) -> str:
+    return f"{offset}\t{length}\t{when}\t{kind}\n"
+
+
+def read_index(path: Path) -> list[tuple[int, int, str, str]]:
+    """(byte offset, byte length, timestamp, type) per entry; a torn last row is ignored."""
+    try:
+        text = index_path(path).read_text(encoding="utf-8")
+    except OSError:
+        return []
+    rows = []
+    for line in text.split("\n")[:-1]:
+        parts = line.split("\t")
+        if len(parts) != 4 or not parts[0].isdigit() or not parts[1].isdigit():
+            break
+        rows.append((int(parts[0]), int(parts[1]), parts[2], parts[3]))
+    return rows
+
+
+def rebuild_index(path: Path, raw: bytes, body_at: int, fresh: int) -> tuple[int, int]:
+    """Re-derive every entry's offset from the file. Timestamps already indexed are kept by
+    position; the last `fresh` entries are stamped now, and entries that predate the index
+    have none. Returns (entries, index size)."""
+    old = read_index(path)
+    spans = []
+    pos = body_at
+    for line in raw[body_at:].splitlines(keepends=True):
+        if line.startswith(b"- "):
+            spans.append((pos, len(line), entry_kind(line.decode("utf-8", "replace"))))
+        pos += len(line)
+    when = stamp()
+    rows = []
+    for i, (offset, length, kind) in enumerate(spans):
+        if i >= len(spans) - fresh:
+            rows.append(index_row(offset, length, when, kind))
+        else:
+            rows.append(index_row(offset, length, old[i][2] if i < len(old) else "", kind))
+    data = "".join(rows)
+    tmp = temp_name(index_path(path))
+    tmp.write_text(data, encoding="utf-8")
+    os.replace(tmp, index_path(path))
+    return len(rows), len(data.encode("utf-8"))
+
+
+def describe(path: Path, raw: bytes, fresh: int = 0) -> dict:
+    """The sidecar head for `raw` as it now sits at `path`, rebuilding the index to match."""
+    close = raw.find(b"\n---\n", 3)
+    if not raw.startswith(b"---\n") or close < 0:
+        raise ValueError(".memlog.md has no frontmatter")
+    field = raw.rfind(b"\nupdated: ", 0, close)
+    offset = field + len(b"\nupdated: ") if field >= 0 else None
+    body_at = close + len(b"\n---\n")
+    entries, idx_size = rebuild_index(path, raw, body_at, fresh)
+    st = os.stat(path)
+    return {
+        "ino": st.st_ino,
+        "mtime_ns": st.st_mtime_ns,
+        "size": len(raw),
+        "entries": entries,
+        "updated_at": offset if offset is not None and close - offset == UPDATED_WIDTH else None,
+        "body_at": body_at,
+        "indexed": entries,
+        "idx_size": idx_size,
+    }
+
+
+def commit(path: Path, meta: dict, body: str, fresh: int = 0) -> int:
+    """Full rewrite of the memlog, then record the sidecar head and index for the O(1) append
+    path. `fresh` is how many entries at the end of `body` this write adds."""
+    text = render(meta, body)
+    write_atomic(path, text)
+    head = describe(path, text.encode("utf-8"), fresh)
+    save_head(path, head)
+    return head["entries"]
+
+
+def adopt_tail(fd: int, committed: int, size: int) -> tuple[int, int]:
+    """Bytes past the committed size come from a write whose ack never printed. Keep the
+    whole lines (they are fsync'd entries) and truncate a torn partial line.
+    Returns (new size, entries adopted)."""
+    tail = os.pread(fd, size - committed, committed)
+    keep = tail[:tail.rfind(b"\n") + 1]
+    if len(keep) != len(tail):
+        os.ftruncate(fd, committed + len(keep))
+    return committed + len(keep), sum(1 for ln in keep.splitlines() if ln.startswith(b"- "))
+
+
+def append_fast(path: Path, entries: list[str]) -> int | None:
+    """O(1) append of whole entry lines with one fsync. Returns the new entry count, or
+    None when the sidecar can't vouch for the file and the full rewrite must run."""
+    head = load_head(path)
+    if not head or not head.get("entries") or head.get("updated_at") is None or not head.get("body_at") \
+            or not hasattr(os, "pwrite"):
+        return None
+    fd = os.open(path, os.O_RDWR)
+    try:
+        st = os.fstat(fd)
+        if st.st_ino != head.get("ino") or st.st_size < head.get("size", 0):
+            return None
+        if st.st_size == head["size"] and st.st_mtime_ns != head.get("mtime_ns"):
+            return None  # rewritten in place by something else: trust only a full re-read
+        size, count, adopted = st.st_size, head["entries"], 0
+        if size > head["size"]:
+            size, adopted = adopt_tail(fd, head["size"], size)
+            count += adopted
+        data = "".join(entry + "\n" for entry in entries).encode("utf-8")
+        afd = os.open(path, os.O_WRONLY | os.O_APPEND)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(afd, view):]
+        finally:
+            os.close(afd)
+        os.pwrite(fd, now().encode("ascii"), head["updated_at"])
+        os.fsync(fd)
+        mtime_ns = os.fstat(fd).st_mtime_ns
+    finally:
+        os.close(fd)
+    count += len(entries)
+    idx_size = append_index(path, head, size, entries) if not adopted else None
+    if idx_size is None:  # the index lags the file: re-derive it once from the file
+        _, idx_size = rebuild_index(path, path.read_bytes(), head["body_at"], len(entries))
+    save_head(path, dict(head, mtime_ns=mtime_ns, size=size + len(data), entries=count,
+                         indexed=count, idx_size=idx_size))
+    return count
+
+
+def append_index(path: Path, head: dict, offset: int, entries: list[str]) -> int | None:
+    """Append index rows for entries just written at `offset`; None if the index can't be
+    trusted to line up with the file (missing, torn, or behind)."""
+    try:
+        size = index_path(path).stat().st_size
+    except OSError:
+        return None
+    if head.get("indexed") != head["entries"] or size != head.get("idx_size"):
+        return None
+    when = stamp()
+    rows = []
+    for entry in entries:
+        length = len(entry.encode("utf-8")) + 1
+        rows.append(index_row(offset, length, when, entry_kind(entry)))
+        offset += length
+    data = "".join(rows).encode("utf-8")
+    fd = os.open(index_path(path), os.O_WRONLY | os.O_APPEND)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return size + len(data)
+
+
+def format_entry(text: str, kind: str | None, by: str | None) -> str:
+    text = " ".join(text.split())  # collapse newlines/runs → one-line entry, no prose bloat
+    label = kind or ""
+    if by:
+        label = f"{label} by {by}".strip()  # attribution: "(idea by user)" / "(by coach)"
+    tag = f"({label}) " if label else ""
+    return f"- {tag}{text}"
+
+
+def ack(path: Path, entries: int) -> None:
     """Echo new state so the caller never re-reads the file to know where it stands."""
     print(json.dumps({
         "ok": True,
         "memlog": str(path),
-        "entries": entry_count(body),
+        "entries": entries,
     }))
 
 
+def segment_dir(path: Path) -> Path:
+    """.memlog.md -> .memlog.d/ (segment files NNNN.md plus manifest.json)."""
+    return path.with_suffix(".d")
+
+
+def load_manifest(path: Path) -> dict | None:
+    try:
+        manifest = json.loads((segment_dir(path) / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def save_manifest(path: Path, manifest: dict) -> None:
+    """Unlike the head and index, the manifest is the only record of segment order, so it
+    gets the same fsync'd temp + rename as the memlog itself."""
+    segment_dir(path).mkdir(exist_ok=True)
+    write_atomic(segment_dir(path) / "manifest.json", json.dumps(manifest, indent=2) + "\n")
+
+
+def segments(path: Path, manifest: dict | None) -> list[Path]:
+    """Every file holding entries, oldest first: the memlog itself, then .memlog.d/NNNN.md."""
+    names = [seg["name"] for seg in (manifest or {}).get("segments", [])]
+    return [path] + [segment_dir(path) / name for name in names]
+
+
+def active_segment(path: Path, manifest: dict | None) -> Path:
+    """Where the next entry goes, sealing the active segment first if it is over its limits.
+
+    Sealing only records the segment's final entry count in the manifest and names the
+    next file; no entry ever moves, so chronology is simply manifest order then file order.
+    """
+    active = segments(path, manifest)[-1]
+    if manifest is None or not active.exists():
+        return active
+    head = current_head(active)
+    full = (manifest.get("max_entries") and head["entries"] >= manifest["max_entries"]) or \
+           (manifest.get("max_bytes") and head["size"] - head["body_at"] >= manifest["max_bytes"])
+    if not full or not head["entries"]:
+        return active
+    if active == path:
+        manifest["root_entries"] = head["entries"]
+    else:
+        manifest["segments"][-1]["entries"] = head["entries"]
+    name = f"{len(manifest['segments']) + 1:04d}.md"
+    manifest["segments"].append({"name": name, "entries": None})
+    save_manifest(path, manifest)
+    return segment_dir(path) / name
+
+
+def total_entries(path: Path, manifest: dict | None, active: Path, active_entries: int) -> int:
+    if manifest is None or active == path:
+        return active_entries
+    sealed = manifest.get("root_entries") or 0
+    sealed += sum(seg.get("entries") or 0 for seg in manifest["segments"][:-1])
+    return sealed + active_entries
+
+
+def stamp_root(path: Path) -> None:
+    """Keep the memlog's own `updated` current while entries land in a later segment."""
+    head = current_head(path)
+    if head.get("updated_at") is None:
+        meta, body = split(path.read_text(encoding="utf-8"))
+        touch(meta)
+        commit(path, meta, body)
+        return
+    fd = os.open(path, os.O_RDWR)
+    try:
+        os.pwrite(fd, now().encode("ascii"), head["updated_at"])
+        mtime_ns = os.fstat(fd).st_mtime_ns
+    finally:
+        os.close(fd)
+    save_head(path, dict(head, mtime_ns=mtime_ns))
+
+
 def cmd_init(args) -> int:
     path = resolve(args)
-    if path.exists():
-        print(f"error: {path} already exists; use append/set to update it", file=sys.stderr)
-        return 2
-    path.parent.mkdir(parents=True, exist_ok=True)
     meta: dict[str, str] = {}
     for pair in args.field or []:
         if "=" not in pair:
@@ -155,35 +495,163 @@ def cmd_init(args) -> int:
             return 2
         k, v = pair.split("=", 1)
         meta[k.strip()] = v.strip()
-    touch(meta)
-    write_atomic(path, render(meta, ""))
-    ack(path, "")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with locked(path):  # two racing inits: exactly one creates, the other sees it exists
+        if path.exists():
+            print(f"error: {path} already exists; use append/set to update it", file=sys.stderr)
+            return 2
+        touch(meta)
+        entries = commit(path, meta, "")
+        if args.segment_entries or args.segment_bytes:
+            save_manifest(path, {"version": 1, "max_entries": args.segment_entries,
+                                 "max_bytes": args.segment_bytes, "segments": []})
+        ack(path, entries)
     return 0
 
 
+def read_batch(stream) -> list[str]:
+    """JSONL entries ({"text", "type", "by"}), one per line, formatted in input order."""
+    entries = []
+    for n, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            item = json.loads(line)
+        except ValueError as exc:
+            raise ValueError(f"line {n}: {exc}") from None
+        if not isinstance(item, dict) or not isinstance(item.get("text"), str):
+            raise ValueError(f"line {n}: expected an object with a string \"text\"")
+        entries.append(format_entry(item["text"], item.get("type"), item.get("by")))
+    return entries
+
+
 def cmd_append(args) -> int:
     path = resolve(args)
-    meta, body = split(path.read_text(encoding="utf-8"))
-    text = " ".join(args.text.split())  # collapse newlines/runs → one-line entry, no prose bloat
-    label = args.type or ""
-    if args.by:
-        label = f"{label} by {args.by}".strip()  # attribution: "(idea by user)" / "(by coach)"
-    tag = f"({label}) " if label else ""
-    entry = f"- {tag}{text}"
-    body = (body.rstrip("\n") + "\n" + entry) if body.strip() else entry  # always at the end
-    touch(meta)
-    write_atomic(path, render(meta, body))
-    ack(path, body)
+    if args.batch:
+        try:
+            new = read_batch(sys.stdin)
+        except ValueError as exc:
+            print(f"error: --batch: {exc}; nothing was appended", file=sys.stderr)
+            return 2
+    else:
+        new = [format_entry(args.text, args.type, args.by)]
+    with locked(path):
+        manifest = load_manifest(path)
+        if not new:  # an empty batch writes nothing; just report where the log stands
+            active = segments(path, manifest)[-1]
+            count = current_head(active)["entries"] if active.exists() else 0
+            ack(path, total_entries(path, manifest, active, count))
+            return 0
+        active = active_segment(path, manifest)
+        # A whole batch lands in one write and one fsync: one group commit, not one per idea.
+        entries = append_fast(active, new)
+        if entries is None:
+            if active.exists():
+                meta, body = split(active.read_text(encoding="utf-8"))
+            else:  # a freshly opened segment: just enough frontmatter to be a memlog itself
+                meta, body = {"segment": active.stem}, ""
+            lines = "\n".join(new)
+            body = (body.rstrip("\n") + "\n" + lines) if body.strip() else lines  # always at the end
+            touch(meta)
+            entries = commit(active, meta, body, fresh=len(new))
+        if active != path:
+            stamp_root(path)
+    ack(path, total_entries(path, manifest, active, entries))
     return 0
 
 
 def cmd_set(args) -> int:
     path = resolve(args)
-    meta, body = split(path.read_text(encoding="utf-8"))
-    meta[args.key] = args.value
-    touch(meta)
-    write_atomic(path, render(meta, body))
-    ack(path, body)
+    with locked(path):
+        manifest = load_manifest(path)
+        meta, body = split(path.read_text(encoding="utf-8"))
+        meta[args.key] = args.value
+        touch(meta)
+        entries = commit(path, meta, body)
+        active = segments(path, manifest)[-1]
+        if active != path:
+            entries = current_head(active)["entries"] if active.exists() else 0
+    ack(path, total_entries(path, manifest, active, entries))
+    return 0
+
+
+def cmd_segment(args) -> int:
+    """Turn segmentation on (or retune it) for an existing memlog; no entry moves."""
+    path = resolve(args)
+    with locked(path):
+        manifest = load_manifest(path) or {"version": 1, "segments": []}
+        manifest["max_entries"] = args.max_entries
+        manifest["max_bytes"] = args.max_bytes
+        save_manifest(path, manifest)
+        active = segments(path, manifest)[-1]
+        count = current_head(active)["entries"] if active.exists() else 0
+    ack(path, total_entries(path, manifest, active, count))
+    return 0
+
+
+def current_head(path: Path) -> dict:
+    """The sidecar head, re-derived from the file if it no longer describes it (a log
+    written by hand or by an older memlog.py)."""
+    head = load_head(path) or {}
+    st = os.stat(path)
+    if (head.get("ino"), head.get("size"), head.get("mtime_ns")) == (st.st_ino, st.st_size, st.st_mtime_ns) \
+            and head.get("body_at") and head.get("indexed") == head.get("entries") \
+            and index_path(path).exists() and index_path(path).stat().st_size == head.get("idx_size"):
+        return head
+    head = describe(path, path.read_bytes())
+    save_head(path, head)
+    return head
+
+
+def cmd_tail(args) -> int:
+    path = resolve(args)
+    kinds = {k.strip() for k in args.type.split(",") if k.strip()} if args.type else None
+    with locked(path):
+        files = [seg for seg in segments(path, load_manifest(path)) if seg.exists()]
+        heads = [current_head(seg) for seg in files]
+        total = sum(head["entries"] for head in heads)
+        picked: list[tuple[Path, int, int]] = []
+        # Newest segment first, so `--n` stops as soon as the window is full.
+        for seg in reversed(files):
+            rows = [
+                (seg, offset, length) for offset, length, when, kind in read_index(seg)
+                if (kinds is None or kind in kinds) and (args.since is None or when >= args.since)
+            ]
+            picked = rows + picked
+            if args.n is not None and len(picked) >= args.n:
+                break
+        if args.n is not None:
+            picked = picked[max(len(picked) - args.n, 0):] if args.n > 0 else []
+        with open(path, "rb") as f:
+            header = f.read(heads[0]["body_at"])
+        lines = []
+        for seg, offset, length in picked:
+            with open(seg, "rb") as f:
+                f.seek(offset)
+                lines.append(f.read(length))
+    sys.stdout.write(header.decode("utf-8") + "\n")
+    sys.stdout.write(f"<!-- memlog tail: {len(picked)} of {total} entries -->\n")
+    sys.stdout.write(b"".join(lines).decode("utf-8"))
+    return 0
+
+
+def cmd_cat(args) -> int:
+    """Stream the whole log, every segment in order, as one memlog-shaped document."""
+    path = resolve(args)
+    out = sys.stdout.buffer
+    with locked(path):
+        files = segments(path, load_manifest(path))
+        with open(path, "rb") as f:
+            shutil.copyfileobj(f, out)
+        for seg in files[1:]:
+            if not seg.exists():
+                continue
+            head = current_head(seg)
+            with open(seg, "rb") as f:
+                f.seek(head["body_at"])
+                out.write(f.read(1).lstrip(b"\n"))  # the blank line under the segment's fence
+                shutil.copyfileobj(f, out)
+    out.flush()
     return 0
 
 
@@ -201,11 +669,16 @@ def main(argv: list[str] | None = None) -> int:
     pi = sub.add_parser("init", help="create the memlog")
     add_target(pi)
     pi.add_argument("--field", action="append", metavar="KEY=VALUE", help="frontmatter field (repeatable)")
+    pi.add_argument("--segment-entries", type=int, metavar="N", help="roll new entries into .memlog.d/ every N entries")
+    pi.add_argument("--segment-bytes", type=int, metavar="B", help="roll new entries into .memlog.d/ once a body passes B bytes")
     pi.set_defaults(func=cmd_init)
 
     pa = sub.add_parser("append", help="append one entry at the end")
     add_target(pa)
-    pa.add_argument("--text", required=True)
+    src = pa.add_mutually_exclusive_group(required=True)
+    src.add_argument("--text")
+    src.add_argument("--batch", action="store_true",
+                     help='read JSONL entries {"text", "type", "by"} from stdin and append them in order with one fsync')
     pa.add_argument("--type", help="entry kind, rendered as an inline tag")
     pa.add_argument("--by", help="who the entry came from (e.g. user, coach); rendered into the tag")
     pa.set_defaults(func=cmd_append)
@@ -216,6 +689,23 @@ def main(argv: list[str] | None = None) -> int:
     pset.add_argument("--value", required=True)
     pset.set_defaults(func=cmd_set)
 
+    pt = sub.add_parser("tail", help="print the frontmatter and a window of entries (resume without reading it all)")
+    add_target(pt)
+    pt.add_argument("--n", type=int, help="only the last N matching entries")
+    pt.add_argument("--since", metavar="TIMESTAMP", help="only entries logged at or after this ISO time (e.g. 2026-06-07T14)")
+    pt.add_argument("--type", help="only these entry types, comma-separated (e.g. decision,direction)")
+    pt.set_defaults(func=cmd_tail)
+
+    pc = sub.add_parser("cat", help="stream the whole log, every segment in order")
+    add_target(pc)
+    pc.set_defaults(func=cmd_cat)
+
+    pseg = sub.add_parser("segment", help="enable or retune segmentation for an existing memlog")
+    add_target(pseg)
+    pseg.add_argument("--max-entries", type=int, metavar="N")
+    pseg.add_argument("--max-bytes", type=int, metavar="B")
+    pseg.set_defaults(func=cmd_segment)
+
     args = p.parse_args(argv)
     return args.func(args)
 
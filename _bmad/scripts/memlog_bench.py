@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.8"
+# ///
+"""memlog_bench — contention benchmark for memlog.py.
+
+Starts N writer processes against one fresh memlog at the same instant. Each appends
+its own numbered entries (singly, or in `--batch` groups), then the log is checked:
+every entry present exactly once, each writer's entries in the order it wrote them, and
+the sidecar head and index agreeing with the body. Throughput is reported either way; the exit
+status is 1 if anything was lost, duplicated or reordered.
+
+  python3 memlog_bench.py                      # 16 writers x 25 appends
+  python3 memlog_bench.py --batch 5            # group commits of 5
+  python3 memlog_bench.py --rewrite            # every append takes the full-rewrite path
+  python3 memlog_bench.py --rewrite --unlocked # reproduce the lost-update race the lock prevents
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+
+import memlog  # noqa: E402
+
+
+def worker(args) -> int:
+    """One writer: wait for the shared start instant, then append as fast as it can."""
+    if args.unlocked:
+        memlog.locked = lambda path: contextlib.nullcontext()
+    if args.rewrite:
+        memlog.append_fast = lambda path, entries: None
+    while time.time() < args.start:
+        time.sleep(0.001)
+    texts = [f"w{args.worker:02d} e{n:04d}" for n in range(args.entries)]
+    sink = io.StringIO()
+    step = args.batch or 1
+    for i in range(0, len(texts), step):
+        group = texts[i:i + step]
+        with contextlib.redirect_stdout(sink):
+            if args.batch:
+                stdin, sys.stdin = sys.stdin, io.StringIO("".join(json.dumps({"text": t}) + "\n" for t in group))
+                try:
+                    memlog.main(["append", "--path", args.path, "--batch"])
+                finally:
+                    sys.stdin = stdin
+            else:
+                memlog.main(["append", "--path", args.path, "--text", group[0], "--type", "bench"])
+    return 0
+
+
+def verify(path: Path, writers: int, entries: int) -> list[str]:
+    files = [seg for seg in memlog.segments(path, memlog.load_manifest(path)) if seg.exists()]
+    problems = []
+    for seg in files:
+        problems += check_sidecars(seg)
+    with contextlib.redirect_stdout(io.TextIOWrapper(io.BytesIO(), encoding="utf-8")) as out:
+        memlog.main(["cat", "--path", str(path)])
+        out.flush()
+        _meta, body = memlog.split(out.buffer.getvalue().decode("utf-8"))
+    seen: dict[str, int] = {}
+    last: dict[str, int] = {}
+    lines = [line for line in body.splitlines() if line.startswith("- ")]
+    for line in lines:
+        match = re.search(r"(w\d+) e(\d+)$", line)
+        if not match:
+            continue
+        writer, n = match.group(1), int(match.group(2))
+        key = f"{writer} e{n:04d}"
+        seen[key] = seen.get(key, 0) + 1
+        if n <= last.get(writer, -1):
+            problems.append(f"reordered: {key} after e{last[writer]:04d}")
+        last[writer] = max(n, last.get(writer, -1))
+    expected = {f"w{w:02d} e{n:04d}" for w in range(writers) for n in range(entries)}
+    lost = sorted(expected - set(seen))
+    dupes = sorted(k for k, c in seen.items() if c > 1)
+    if lost:
+        problems.append(f"lost {len(lost)} entries (e.g. {', '.join(lost[:3])})")
+    if dupes:
+        problems.append(f"duplicated {len(dupes)} entries (e.g. {', '.join(dupes[:3])})")
+    return problems
+
+
+def check_sidecars(path: Path) -> list[str]:
+    """The head and index of one file must agree with what is actually in it."""
+    problems = []
+    _meta, body = memlog.split(path.read_text(encoding="utf-8"))
+    count = memlog.entry_count(body)
+    head = memlog.load_head(path) or {}
+    if head.get("entries") != count:
+        problems.append(f"{path.name}: sidecar head says {head.get('entries')} entries, body has {count}")
+    rows = memlog.read_index(path)
+    raw = path.read_bytes()
+    if len(rows) != count or any(not raw[o:o + n].startswith(b"- ") or raw[o + n - 1:o + n] != b"\n" for o, n, _, _ in rows):
+        problems.append(f"{path.name}: index has {len(rows)} rows for {count} entries or points off an entry line")
+    return problems
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--writers", type=int, default=16)
+    p.add_argument("--entries", type=int, default=25, help="entries per writer")
+    p.add_argument("--batch", type=int, default=0, help="append in --batch groups of this size (0 = one entry per call)")
+    p.add_argument("--segment-entries", type=int, help="init the log with segmentation every N entries")
+    p.add_argument("--rewrite", action="store_true", help="skip the O(1) append path; every append rewrites the file")
+    p.add_argument("--unlocked", action="store_true", help="disable the lock to show the race it prevents")
+    p.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    p.add_argument("--path", help=argparse.SUPPRESS)
+    p.add_argument("--start", type=float, help=argparse.SUPPRESS)
+    args = p.parse_args(argv)
+    if args.worker is not None:
+        return worker(args)
+
+    with tempfile.TemporaryDirectory(prefix="memlog-bench-") as tmp:
+        path = Path(tmp) / memlog.MEMLOG
+        with contextlib.redirect_stdout(io.StringIO()):
+            memlog.main(["init", "--path", str(path), "--field", "topic=contention benchmark"]
+                        + (["--segment-entries", str(args.segment_entries)] if args.segment_entries else []))
+            memlog.main(["append", "--path", str(path), "--text", "benchmark start", "--type", "event"])
+        start = time.time() + 0.5 + 0.05 * args.writers  # let every interpreter boot first
+        common = ["--path", str(path), "--start", str(start), "--entries", str(args.entries), "--batch", str(args.batch)]
+        common += [flag for flag, on in (("--rewrite", args.rewrite), ("--unlocked", args.unlocked)) if on]
+        procs = [
+            subprocess.Popen([sys.executable, __file__, "--worker", str(w)] + common)
+            for w in range(args.writers)
+        ]
+        failed = sum(proc.wait() != 0 for proc in procs)
+        elapsed = time.time() - start
+        total = args.writers * args.entries
+        problems = verify(path, args.writers, args.entries) + (
+            [f"{failed} writer(s) exited non-zero"] if failed else []
+        )
+    mode = f"batch={args.batch}" if args.batch else "single"
+    path_kind = "rewrite" if args.rewrite else "append"
+    lock = "unlocked" if args.unlocked else "locked"
+    print(f"writers={args.writers} entries={total} mode={mode} {path_kind} {lock}: "
+          f"{elapsed:.2f}s, {total / elapsed:.0f} entries/s, {elapsed / total * 1e3:.2f} ms/entry")
+    for problem in problems:
+        print(f"FAIL {problem}")
+    if not problems:
+        print("OK no entries lost, duplicated or reordered")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
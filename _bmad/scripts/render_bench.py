@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.11"
+# ///
+"""render_bench — microbenchmarks for render_skill.py token resolution.
+
+  python3 render_bench.py config                 # 10k-key config, 500 short tokens
+  python3 render_bench.py config --keys 50000    # scale the config up
+  python3 render_bench.py tokens                 # 300 sources, 6000 tokens: three scans vs one
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+sys.dont_write_bytecode = True
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+
+import render_skill  # noqa: E402
+
+
+def synthetic_config(keys: int, width: int = 100) -> dict[str, Any]:
+    """`keys` uniquely named string leaves, `width` per table, two tables deep."""
+    config: dict[str, Any] = {}
+    for n in range(keys):
+        section = config.setdefault(f"section_{n // (width * width)}", {})
+        group = section.setdefault(f"group_{n // width % width}", {})
+        group[f"key_{n}"] = f"value {n}"
+    return config
+
+
+def scan_config_values(data: Any, key: str, prefix: str = "") -> list[tuple[str, Any]]:
+    """The per-token recursive walk short tokens used before the config index."""
+    matches: list[tuple[str, Any]] = []
+    if not isinstance(data, dict):
+        return matches
+    for name, value in data.items():
+        path = f"{prefix}.{name}" if prefix else name
+        if name == key and not isinstance(value, (dict, list)):
+            matches.append((path, value))
+        matches.extend(scan_config_values(value, key, path))
+    return matches
+
+
+def synthetic_skill(files: int, tokens: int, keys: int) -> tuple[dict[str, str], dict, dict]:
+    """Sources with `tokens` mixed render tokens, plus the config and customization they use."""
+    central = synthetic_config(keys)
+    customization = {"workflow": {f"item_{n}": f"custom {n} in {{skill-root}}" for n in range(100)}}
+    sources = {f"steps/step-{n:04d}.md": [] for n in range(files)}
+    sources["workflow.md"] = []
+    names = list(sources)
+    for n in range(tokens):
+        kind = n % 4
+        if kind == 0:
+            token = f"{{{{.key_{n % keys}}}}}"
+        elif kind == 1:
+            path = f"section_{n % keys // 10000}.group_{n % keys // 100 % 100}.key_{n % keys}"
+            token = f"{{{{config.{path}}}}}"
+        elif kind == 2:
+            token = f"{{workflow.item_{n % 100}}}"
+        else:
+            token = f"[[bmad-snapshot:{names[n % files]}]]"
+        sources[names[n % len(names)]].append(f"Prose before token {n}: {token} and after.\n")
+    return {name: "".join(lines) for name, lines in sources.items()}, central, customization
+
+
+def three_scan_render(
+    sources: dict[str, str],
+    central: dict[str, Any],
+    customization: dict[str, Any],
+    root: Path,
+    destination: Path,
+) -> dict[str, str]:
+    """Discovery by three finditer scans, then a fresh alternation of every token, as render did before."""
+    leaves, paths = render_skill._index_config(central)
+    replacements: dict[str, str] = {}
+    for content in sources.values():
+        for match in render_skill._SHORT_CONFIG_TOKEN.finditer(content):
+            replacements[match.group(0)] = render_skill._resolve_short_config(
+                leaves, match.group(1), root
+            )[1]
+        for match in render_skill._CONFIG_TOKEN.finditer(content):
+            replacements[match.group(0)] = render_skill._config_value(
+                central, paths, match.group(1), root
+            )
+        for match in render_skill._CUSTOM_TOKEN.finditer(content):
+            path = f"workflow.{match.group(1)}"
+            replacements[match.group(0)] = render_skill._resolve_customization_value(
+                render_skill._lookup(customization, path, "customization value"),
+                render_skill._lookup(customization, path, "customization default"),
+                f"customization.{path}",
+            )[1].replace("{skill-root}", str(destination))
+    pattern = re.compile(
+        "|".join(
+            [
+                *(re.escape(token) for token in sorted(replacements, key=len, reverse=True)),
+                render_skill._SNAPSHOT_TOKEN.pattern,
+            ]
+        )
+    )
+
+    def replace(match: re.Match[str]) -> str:
+        token = match.group(0)
+        if token in replacements:
+            return replacements[token]
+        return str(destination / render_skill._SNAPSHOT_TOKEN.fullmatch(token).group(1))
+
+    return {name: pattern.sub(replace, content) for name, content in sources.items()}
+
+
+def best_of(repeat: int, run) -> tuple[float, Any]:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = run()
+        timings.append((time.perf_counter() - started) * 1000)
+    return min(timings), result
+
+
+def bench_config(args) -> int:
+    central = synthetic_config(args.keys)
+    step = max(args.keys // args.tokens, 1)
+    tokens = [f"key_{(n * step) % args.keys}" for n in range(args.tokens)]
+    root = Path("/")
+
+    def walk_per_token() -> list[tuple[str, Any]]:
+        return [scan_config_values(central, key)[0] for key in tokens]
+
+    def indexed() -> list[tuple[str, Any]]:
+        leaves, _paths = render_skill._index_config(central)
+        return [render_skill._resolve_short_config(leaves, key, root) for key in tokens]
+
+    walk_ms, expected = best_of(args.repeat, walk_per_token)
+    index_ms, actual = best_of(args.repeat, indexed)
+    build_ms, _ = best_of(args.repeat, lambda: render_skill._index_config(central))
+    print(
+        f"config keys={args.keys} short tokens={args.tokens}: "
+        f"per-token walk {walk_ms:.1f} ms, index {index_ms:.1f} ms "
+        f"(build {build_ms:.1f} ms), {walk_ms / index_ms:.0f}x"
+    )
+    if actual != expected:
+        print("FAIL index and walk resolved different values")
+        return 1
+    return 0
+
+
+def bench_tokens(args) -> int:
+    sources, central, customization = synthetic_skill(args.files, args.tokens, args.keys)
+    root = Path("/project")
+    destination = root / "_bmad" / "render" / "bench" / "generation"
+
+    def one_scan() -> dict[str, str]:
+        templates = {name: render_skill._tokenize(content) for name, content in sources.items()}
+        replacements, _values = render_skill._resolve_replacements(
+            templates, central, customization, customization, root
+        )
+        return render_skill._render_sources(templates, replacements, destination)
+
+    three_ms, expected = best_of(
+        args.repeat,
+        lambda: three_scan_render(sources, central, customization, root, destination),
+    )
+    one_ms, actual = best_of(args.repeat, one_scan)
+    print(
+        f"tokens files={len(sources)} tokens={args.tokens} config keys={args.keys}: "
+        f"three scans + alternation {three_ms:.1f} ms, one tokenizer pass {one_ms:.1f} ms, "
+        f"{three_ms / one_ms:.1f}x"
+    )
+    if actual != expected:
+        print("FAIL the two renderers produced different output")
+        return 1
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    config = commands.add_parser("config", help="short-token lookups: per-token walk vs config index")
+    config.add_argument("--keys", type=int, default=10_000, help="leaf keys in the synthetic config")
+    config.add_argument("--tokens", type=int, default=500, help="short-token occurrences to resolve")
+    config.add_argument("--repeat", type=int, default=3, help="report the best of this many runs")
+    config.set_defaults(run=bench_config)
+    tokens = commands.add_parser("tokens", help="render a synthetic skill: three scans vs one tokenizer pass")
+    tokens.add_argument("--files", type=int, default=300, help="source files in the synthetic skill")
+    tokens.add_argument("--tokens", type=int, default=6000, help="token occurrences across all sources")
+    tokens.add_argument("--keys", type=int, default=1000, help="leaf keys in the synthetic config")
+    tokens.add_argument("--repeat", type=int, default=3, help="report the best of this many runs")
+    tokens.set_defaults(run=bench_tokens)
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
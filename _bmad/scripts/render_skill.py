@@ -7,6 +7,7 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import hashlib
 import json
 import os
@@ -14,13 +15,28 @@ import re
 import shutil
 import sys
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
 # Installed scripts are consumer files, not a location for interpreter caches.
 sys.dont_write_bytecode = True
 
-from config_utils import ConfigError, load_central_config, load_customization, load_toml
+import config_utils
+from config_utils import (
+    ConfigError,
+    central_layer_paths,
+    customization_layer_paths,
+    load_central_config,
+    load_customization,
+    load_skill_defaults,
+)
 
 
 class RenderError(ValueError):
@@ -31,6 +47,34 @@ _CONFIG_TOKEN = re.compile(r"\{\{config\.([A-Za-z0-9_.-]+)\}\}")
 _SHORT_CONFIG_TOKEN = re.compile(r"\{\{\.([A-Za-z0-9_]+)\}\}")
 _CUSTOM_TOKEN = re.compile(r"\{workflow\.([A-Za-z0-9_.-]+)\}")
 _SNAPSHOT_TOKEN = re.compile(r"\[\[bmad-snapshot:([A-Za-z0-9_./-]+\.md)\]\]")
+# Every token kind in one alternation, so each source is scanned exactly once.
+_TOKEN = re.compile(
+    "|".join(
+        f"(?P<{kind}>{pattern.pattern})"
+        for kind, pattern in (
+            ("short", _SHORT_CONFIG_TOKEN),
+            ("config", _CONFIG_TOKEN),
+            ("custom", _CUSTOM_TOKEN),
+            ("snapshot", _SNAPSHOT_TOKEN),
+        )
+    )
+)
+_GENERATION_HASH = re.compile(r"[0-9a-f]{20}")
+_INDEX_NAME = "index.json"
+_INDEX_SCHEMA_VERSION = 1
+_DEPENDENCIES_NAME = "dependencies.json"
+_DEPENDENCIES_SCHEMA_VERSION = 1
+_OBJECTS_NAME = ".objects"
+_OBJECT_STAT_SUFFIX = ".stat"
+_HALT_ERRORS = (ConfigError, RenderError, OSError, UnicodeError, ValueError)
+
+# Central config fingerprints and merged table, loaded once per batch.
+CentralSnapshot = tuple[dict[str, list[int] | None], dict[str, Any]]
+_shared_central: CentralSnapshot | None = None
+# Leaf name -> [(dotted path, value)], and dotted path -> value.
+ConfigIndex = tuple[dict[str, list[tuple[str, Any]]], dict[str, Any]]
+# A tokenized source: literal text interleaved with (kind, argument, token).
+Template = list[str | tuple[str, str, str]]
 
 
 def _hash_bytes(content: bytes) -> str:
@@ -125,22 +169,44 @@ def _resolve_config_value(value: Any, label: str, project_root: Path) -> str:
     return resolved
 
 
-def _find_config_values(data: Any, key: str, prefix: str = "") -> list[tuple[str, Any]]:
-    matches: list[tuple[str, Any]] = []
-    if not isinstance(data, dict):
-        return matches
-    for name, value in data.items():
-        path = f"{prefix}.{name}" if prefix else name
-        if name == key and not isinstance(value, (dict, list)):
-            matches.append((path, value))
-        matches.extend(_find_config_values(value, key, path))
-    return matches
+def _index_config(central: dict[str, Any]) -> ConfigIndex:
+    """Flatten central config once for every token lookup in a render.
+
+    Returns leaf name -> [(dotted path, value)] in document order, for short
+    tokens and their ambiguity check, and dotted path -> value for full
+    tokens. Paths through keys that themselves contain dots are left out of
+    the second map so they resolve, or fail, exactly as a dotted walk would.
+    """
+    leaves: dict[str, list[tuple[str, Any]]] = {}
+    paths: dict[str, Any] = {}
+
+    def walk(table: dict[str, Any], prefix: str, addressable: bool) -> None:
+        for name, value in table.items():
+            path = f"{prefix}.{name}" if prefix else name
+            exact = addressable and "." not in name
+            if isinstance(value, dict):
+                walk(value, path, exact)
+                continue
+            if exact:
+                paths[path] = value
+            if not isinstance(value, list):
+                leaves.setdefault(name, []).append((path, value))
+
+    walk(central, "", True)
+    return leaves, paths
+
+
+def _config_value(
+    central: dict[str, Any], paths: dict[str, Any], path: str, project_root: Path
+) -> str:
+    value = paths[path] if path in paths else _lookup(central, path, "config value")
+    return _resolve_config_value(value, f"config.{path}", project_root)
 
 
 def _resolve_short_config(
-    central: dict[str, Any], key: str, project_root: Path
+    leaves: dict[str, list[tuple[str, Any]]], key: str, project_root: Path
 ) -> tuple[str, str]:
-    matches = _find_config_values(central, key)
+    matches = leaves.get(key, [])
     if not matches:
         raise RenderError(f"missing config value `{key}`")
     if len(matches) > 1:
@@ -189,8 +255,21 @@ def _resolve_customization_value(value: Any, default: Any, label: str) -> tuple[
     raise RenderError(f"{label} has unsupported default type {type(default).__name__}")
 
 
+def _tokenize(content: str) -> Template:
+    """Split a source into literal text and the render tokens authored in it."""
+    pieces: Template = []
+    position = 0
+    for match in _TOKEN.finditer(content):
+        pieces.append(content[position : match.start()])
+        # The kind's own group closes last; its argument is the group nested in it.
+        pieces.append((match.lastgroup, match.group(match.lastindex + 1), match.group(0)))
+        position = match.end()
+    pieces.append(content[position:])
+    return pieces
+
+
 def _resolve_replacements(
-    sources: dict[str, str],
+    templates: dict[str, Template],
     central: dict[str, Any],
     customization: dict[str, Any],
     defaults: dict[str, Any] | None,
@@ -198,41 +277,41 @@ def _resolve_replacements(
 ) -> tuple[dict[str, str], dict[str, Any]]:
     replacements: dict[str, str] = {}
     input_values: dict[str, Any] = {}
-    for content in sources.values():
-        for match in _SHORT_CONFIG_TOKEN.finditer(content):
-            token, key = match.group(0), match.group(1)
-            path, resolved = _resolve_short_config(central, key, project_root)
-            source = f"config.{path}"
-            replacements[token] = resolved
-            input_values[source] = resolved
-        for match in _CONFIG_TOKEN.finditer(content):
-            token, path = match.group(0), match.group(1)
-            source = f"config.{path}"
-            resolved = _resolve_config_value(
-                _lookup(central, path, "config value"), source, project_root
-            )
-            replacements[token] = resolved
-            input_values[source] = resolved
-        for match in _CUSTOM_TOKEN.finditer(content):
-            if defaults is None:
-                raise RenderError("customization tokens require customize.toml")
-            token, relative_path = match.group(0), match.group(1)
-            path = f"workflow.{relative_path}"
-            source = f"customization.{path}"
-            resolved, rendered = _resolve_customization_value(
-                _lookup(customization, path, "customization value"),
-                _lookup(defaults, path, "customization default"),
-                source,
-            )
-            replacements[token] = rendered
-            input_values[source] = resolved
+    leaves, paths = _index_config(central)
+    for pieces in templates.values():
+        for piece in pieces:
+            if isinstance(piece, str) or piece[0] == "snapshot" or piece[2] in replacements:
+                continue
+            kind, argument, token = piece
+            if kind == "short":
+                path, resolved = _resolve_short_config(leaves, argument, project_root)
+                source = f"config.{path}"
+                replacements[token] = resolved
+                input_values[source] = resolved
+            elif kind == "config":
+                source = f"config.{argument}"
+                resolved = _config_value(central, paths, argument, project_root)
+                replacements[token] = resolved
+                input_values[source] = resolved
+            else:
+                if defaults is None:
+                    raise RenderError("customization tokens require customize.toml")
+                path = f"workflow.{argument}"
+                source = f"customization.{path}"
+                resolved, rendered = _resolve_customization_value(
+                    _lookup(customization, path, "customization value"),
+                    _lookup(defaults, path, "customization default"),
+                    source,
+                )
+                replacements[token] = rendered
+                input_values[source] = resolved
     return replacements, input_values
 
 
 def _render_sources(
-    sources: dict[str, str], replacements: dict[str, str], destination: Path
+    templates: dict[str, Template], replacements: dict[str, str], destination: Path
 ) -> dict[str, str]:
-    """Resolve only tokens authored in installed sources in one opaque pass."""
+    """Join each tokenized source with its resolved values; nothing is rescanned."""
     # Workflow customization may reference installed skill files; bind those
     # references to the immutable generation before inserting the prose.
     replacements = {
@@ -241,33 +320,109 @@ def _render_sources(
         else value
         for token, value in replacements.items()
     }
-    source_names = set(sources)
-    patterns = [
-        *(re.escape(token) for token in sorted(replacements, key=len, reverse=True)),
-        _SNAPSHOT_TOKEN.pattern,
-    ]
-    token_pattern = re.compile("|".join(patterns))
-
-    def replace(match: re.Match[str]) -> str:
-        token = match.group(0)
-        if token in replacements:
-            return replacements[token]
-        snapshot = _SNAPSHOT_TOKEN.fullmatch(token)
-        if snapshot is None:
-            raise RenderError(f"unsupported render token: {token}")
-        target = snapshot.group(1)
-        if target not in source_names:
-            raise RenderError(f"snapshot reference targets undeclared source: {target}")
-        return str(destination / target)
-
     rendered: dict[str, str] = {}
-    for name, content in sources.items():
-        # Inserted paths and customization prose are never scanned as source tokens.
-        rendered[name] = token_pattern.sub(replace, content)
+    for name, pieces in templates.items():
+        parts = []
+        for piece in pieces:
+            if isinstance(piece, str):
+                parts.append(piece)
+            elif piece[0] == "snapshot":
+                target = piece[1]
+                if target not in templates:
+                    raise RenderError(
+                        f"snapshot reference targets undeclared source: {target}"
+                    )
+                parts.append(str(destination / target))
+            else:
+                # Inserted paths and customization prose are never scanned as source tokens.
+                parts.append(replacements[piece[2]])
+        rendered[name] = "".join(parts)
     return rendered
 
 
-def _verify_existing(destination: Path, manifest: dict[str, Any]) -> None:
+def _object_path(objects_dir: Path, digest: str) -> Path:
+    return objects_dir / digest[:2] / digest[2:]
+
+
+def _object_stat(path: Path) -> list[int]:
+    stat = path.stat()
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns, stat.st_mode]
+
+
+def _record_object_stat(path: Path) -> None:
+    """Remember the stat an object had when it was stored next to it."""
+    descriptor, temporary = tempfile.mkstemp(prefix=".stat-", dir=path.parent)
+    try:
+        with os.fdopen(descriptor, "wb") as stream:
+            stream.write(_canonical_json(_object_stat(path)))
+        os.replace(temporary, path.with_name(path.name + _OBJECT_STAT_SUFFIX))
+    except OSError:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+def _object_intact(path: Path) -> bool:
+    """True while an object's stat still matches the one recorded when it was stored.
+
+    Generation files are hardlinks to their object, so an in-place edit of
+    either changes this stat; anything else must be re-hashed before use.
+    """
+    try:
+        recorded = json.loads(path.with_name(path.name + _OBJECT_STAT_SUFFIX).read_bytes())
+        return recorded == _object_stat(path)
+    except (OSError, ValueError):
+        return False
+
+
+def _store_object(objects_dir: Path, digest: str, content: bytes) -> Path:
+    """Write ``content`` once under its SHA-256.
+
+    An existing object is reused only while its recorded stat holds or its
+    bytes still hash to ``digest``; an edited one is replaced.
+    """
+    path = _object_path(objects_dir, digest)
+    if _object_intact(path):
+        return path
+    with contextlib.suppress(OSError):
+        if _hash_bytes(path.read_bytes()) == digest:
+            _record_object_stat(path)
+            return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    descriptor, temporary = tempfile.mkstemp(prefix=".object-", dir=path.parent)
+    try:
+        with os.fdopen(descriptor, "wb") as stream:
+            stream.write(content)
+        # Every generation linking this object shares its inode: keep it read-only.
+        os.chmod(temporary, 0o444)
+        os.replace(temporary, path)
+    except OSError:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+    _record_object_stat(path)
+    return path
+
+
+def _place_output(objects_dir: Path, digest: str, content: bytes, path: Path) -> None:
+    try:
+        os.link(_store_object(objects_dir, digest, content), path)
+    except OSError:
+        # No hardlinks on this filesystem, or gc pruned the object in between:
+        # a private copy is still a valid generation file.
+        path.write_bytes(content)
+
+
+def _is_object(path: Path, objects_dir: Path, digest: str) -> bool:
+    """True when ``path`` links the stored object and that object is intact."""
+    object_path = _object_path(objects_dir, digest)
+    try:
+        return os.path.samefile(path, object_path) and _object_intact(object_path)
+    except OSError:
+        return False
+
+
+def _verify_existing(
+    destination: Path, manifest: dict[str, Any], *, trust_objects: bool = False
+) -> None:
     manifest_path = destination / "manifest.json"
     try:
         existing = json.loads(manifest_path.read_text(encoding="utf-8"))
@@ -283,7 +438,11 @@ def _verify_existing(destination: Path, manifest: dict[str, Any]) -> None:
     }
     if actual_files != expected_files:
         raise RenderError(f"generation contains unexpected or missing files: {destination}")
+    objects_dir = destination.parents[2] / _OBJECTS_NAME
     for name, expected_hash in manifest["outputs"].items():
+        if trust_objects and _is_object(destination / name, objects_dir, expected_hash):
+            # An intact object still holds the bytes its name hashes to.
+            continue
         try:
             actual_hash = _hash_bytes((destination / name).read_bytes())
         except OSError as error:
@@ -292,17 +451,25 @@ def _verify_existing(destination: Path, manifest: dict[str, Any]) -> None:
             raise RenderError(f"generation output hash mismatch: {destination / name}")
 
 
-def _publish(destination: Path, outputs: dict[str, bytes], manifest: dict[str, Any]) -> None:
+def _publish(
+    destination: Path,
+    outputs: dict[str, bytes],
+    manifest: dict[str, Any],
+    *,
+    trust_objects: bool = True,
+) -> None:
+    """Assemble the generation from store objects in staging, then rename it into place."""
     destination.parent.mkdir(parents=True, exist_ok=True)
+    objects_dir = destination.parents[2] / _OBJECTS_NAME
     if destination.exists():
-        _verify_existing(destination, manifest)
+        _verify_existing(destination, manifest, trust_objects=trust_objects)
         return
     staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=destination.parent))
     try:
         for name, content in outputs.items():
             path = staging / name
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_bytes(content)
+            _place_output(objects_dir, manifest["outputs"][name], content, path)
         (staging / "manifest.json").write_bytes(
             json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8")
             + b"\n"
@@ -311,7 +478,7 @@ def _publish(destination: Path, outputs: dict[str, bytes], manifest: dict[str, A
             os.rename(staging, destination)
         except OSError:
             if destination.exists():
-                _verify_existing(destination, manifest)
+                _verify_existing(destination, manifest, trust_objects=trust_objects)
             else:
                 raise
     finally:
@@ -319,34 +486,246 @@ def _publish(destination: Path, outputs: dict[str, bytes], manifest: dict[str, A
             shutil.rmtree(staging, ignore_errors=True)
 
 
-def render(project_root: Path, skill_dir: Path) -> Path:
+def _fingerprint(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_ino, stat.st_size, stat.st_mtime_ns]
+
+
+def _input_fingerprints(project_root: Path, skill_dir: Path) -> dict[str, list[int] | None]:
+    """Stat every file a render can read, including absent optional layers."""
+    paths = [
+        Path(__file__).resolve(),
+        Path(config_utils.__file__).resolve(),
+        *central_layer_paths(project_root),
+        *customization_layer_paths(project_root, skill_dir),
+    ]
+    for directory, subdirectories, files in os.walk(skill_dir):
+        subdirectories.sort()
+        paths.extend(
+            Path(directory) / name
+            for name in sorted(files)
+            if name.endswith(".md") and name != "SKILL.md"
+        )
+    return {str(path): _fingerprint(path) for path in paths}
+
+
+def _output_fingerprints(destination: Path) -> dict[str, list[int] | None]:
+    return {
+        path.relative_to(destination).as_posix(): _fingerprint(path)
+        for path in sorted(destination.rglob("*"))
+        if path.is_file()
+    }
+
+
+def _indexed_entry(
+    index_path: Path, skill_dir: Path, inputs: dict[str, list[int] | None]
+) -> Path | None:
+    """Return the indexed workflow.md when no input or output stat has changed."""
+    try:
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeError, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(index, dict)
+        or index.get("schema_version") != _INDEX_SCHEMA_VERSION
+        or index.get("skill_dir") != str(skill_dir)
+        or index.get("inputs") != inputs
+        or not isinstance(index.get("generation"), str)
+        or not _GENERATION_HASH.fullmatch(index["generation"])
+    ):
+        return None
+    destination = index_path.parent / index["generation"]
+    outputs = index.get("outputs")
+    # A vanished generation fingerprints as {}; never serve one without workflow.md.
+    if (
+        not isinstance(outputs, dict)
+        or "workflow.md" not in outputs
+        or not destination.is_dir()
+        or outputs != _output_fingerprints(destination)
+    ):
+        return None
+    return destination / "workflow.md"
+
+
+@contextlib.contextmanager
+def _locked(path: Path):
+    """Exclusive advisory lock on ``path``; a no-op where fcntl is unavailable."""
+    if fcntl is None:
+        yield
+        return
+    with path.open("a") as stream:
+        fcntl.flock(stream, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(stream, fcntl.LOCK_UN)
+
+
+def _load_dependencies(render_root: Path, project_root: Path) -> dict[str, Any] | None:
+    try:
+        dependencies = json.loads((render_root / _DEPENDENCIES_NAME).read_text(encoding="utf-8"))
+    except (OSError, UnicodeError, json.JSONDecodeError):
+        return None
+    if (
+        not isinstance(dependencies, dict)
+        or dependencies.get("schema_version") != _DEPENDENCIES_SCHEMA_VERSION
+        or dependencies.get("project_root") != str(project_root)
+        or not isinstance(dependencies.get("generations"), dict)
+    ):
+        return None
+    return dependencies
+
+
+def _record_dependencies(
+    project_root: Path,
+    destination: Path,
+    skill_dir: Path,
+    replacements: dict[str, str],
+    input_values: dict[str, Any],
+) -> None:
+    """Point every config and customization key this generation consumed at it.
+
+    ``dependencies.json`` holds the live generation of each rendered skill with
+    the values it consumed, and the reverse map from each key to those skills.
+    The caller holds ``.dependencies.lock``.
+    """
+    render_root = project_root / "_bmad" / "render"
+    short_keys = sorted(
+        match.group(1)
+        for match in map(_SHORT_CONFIG_TOKEN.fullmatch, replacements)
+        if match is not None
+    )
+    dependencies = _load_dependencies(render_root, project_root) or {}
+    generations = dependencies.get("generations", {})
+    generations[destination.parent.relative_to(render_root).as_posix()] = {
+        "skill_dir": str(skill_dir),
+        "generation": destination.name,
+        "short_keys": short_keys,
+        "resolved_values": input_values,
+    }
+    keys: dict[str, list[str]] = {}
+    for name, generation in sorted(generations.items()):
+        for key in generation["resolved_values"]:
+            keys.setdefault(key, []).append(name)
+    document = {
+        "schema_version": _DEPENDENCIES_SCHEMA_VERSION,
+        "project_root": str(project_root),
+        "keys": dict(sorted(keys.items())),
+        "generations": generations,
+    }
+    descriptor, temporary = tempfile.mkstemp(prefix=".dependencies-", dir=render_root)
+    try:
+        with os.fdopen(descriptor, "wb") as stream:
+            stream.write(
+                json.dumps(document, ensure_ascii=False, indent=2, sort_keys=True).encode("utf-8")
+                + b"\n"
+            )
+        os.replace(temporary, render_root / _DEPENDENCIES_NAME)
+    except OSError:
+        Path(temporary).unlink(missing_ok=True)
+        raise
+
+
+def _write_index(
+    index_path: Path,
+    skill_dir: Path,
+    destination: Path,
+    inputs: dict[str, list[int] | None],
+) -> None:
+    outputs = _output_fingerprints(destination)
+    if "workflow.md" not in outputs:
+        # The generation is gone (or was never whole): record nothing for it.
+        return
+    index = {
+        "schema_version": _INDEX_SCHEMA_VERSION,
+        "skill_dir": str(skill_dir),
+        "generation": destination.name,
+        "inputs": inputs,
+        "outputs": outputs,
+    }
+    descriptor, temporary = tempfile.mkstemp(prefix=".index-", dir=index_path.parent)
+    try:
+        with os.fdopen(descriptor, "wb") as stream:
+            stream.write(_canonical_json(index) + b"\n")
+        os.replace(temporary, index_path)
+    except OSError:
+        # The index is only a shortcut; the next render falls back to a full pass.
+        Path(temporary).unlink(missing_ok=True)
+
+
+def _central_snapshot(project_root: Path) -> CentralSnapshot:
+    fingerprints = {str(path): _fingerprint(path) for path in central_layer_paths(project_root)}
+    return fingerprints, load_central_config(project_root)
+
+
+def render(
+    project_root: Path,
+    skill_dir: Path,
+    *,
+    verify: bool = False,
+    central: CentralSnapshot | None = None,
+) -> Path:
+    """Publish the skill's generation and return its workflow.md.
+
+    Unless ``verify`` is set, a generation whose inputs and outputs still match
+    the stat fingerprints recorded by the last render is returned without
+    reading, resolving or re-hashing anything.
+    """
+    return _render(project_root, skill_dir, verify=verify, central=central)[0]
+
+
+def _render(
+    project_root: Path,
+    skill_dir: Path,
+    *,
+    verify: bool,
+    central: CentralSnapshot | None,
+) -> tuple[Path, bool]:
+    """Return the generation's workflow.md and whether the input index served it."""
     project_root = project_root.resolve(strict=True)
     skill_dir = skill_dir.resolve(strict=True)
     if not (project_root / "_bmad").is_dir():
         raise RenderError(f"project root does not contain _bmad/: {project_root}")
 
+    root_hash = _hash_bytes(str(project_root).encode("utf-8"))[:12]
+    slug = re.sub(r"[^a-z0-9]+", "-", project_root.name.lower()).strip("-") or "project"
+    slug = slug[:80].rstrip("-") or "project"
+    project_dir = project_root / "_bmad" / "render" / skill_dir.name / f"{slug}-{root_hash}"
+    index_path = project_dir / _INDEX_NAME
+    # Fingerprint before reading so an edit racing this render invalidates the index.
+    inputs = _input_fingerprints(project_root, skill_dir)
+    if not verify:
+        entry = _indexed_entry(index_path, skill_dir, inputs)
+        if entry is not None:
+            return entry, True
+
     sources = _load_sources(skill_dir)
-    central = load_central_config(project_root)
+    # A batch's preloaded config is only used while its layers are unchanged.
+    if central is not None and all(
+        inputs.get(path) == fingerprint for path, fingerprint in central[0].items()
+    ):
+        central_config = central[1]
+    else:
+        central_config = load_central_config(project_root)
+    templates = {name: _tokenize(content) for name, content in sources.items()}
     has_customization = any(
-        _CUSTOM_TOKEN.search(content) for content in sources.values()
-    )
-    defaults = (
-        load_toml(skill_dir / "customize.toml", required=True)
-        if has_customization
-        else None
+        not isinstance(piece, str) and piece[0] == "custom"
+        for pieces in templates.values()
+        for piece in pieces
     )
+    defaults = load_skill_defaults(skill_dir) if has_customization else None
     customization = (
         load_customization(project_root, skill_dir) if has_customization else {}
     )
     replacements, input_values = _resolve_replacements(
-        sources, central, customization, defaults, project_root
+        templates, central_config, customization, defaults, project_root
     )
     source_hashes = {
         name: _hash_bytes(content.encode("utf-8")) for name, content in sources.items()
     }
-    root_hash = _hash_bytes(str(project_root).encode("utf-8"))[:12]
-    slug = re.sub(r"[^a-z0-9]+", "-", project_root.name.lower()).strip("-") or "project"
-    slug = slug[:80].rstrip("-") or "project"
     renderer_hash = _hash_bytes(Path(__file__).read_bytes())
     identity = {
         "project_root": str(project_root),
@@ -355,15 +734,8 @@ def render(project_root: Path, skill_dir: Path) -> Path:
         "source_sha256": source_hashes,
     }
     generation_hash = _hash_bytes(_canonical_json(identity))[:20]
-    destination = (
-        project_root
-        / "_bmad"
-        / "render"
-        / skill_dir.name
-        / f"{slug}-{root_hash}"
-        / generation_hash
-    )
-    rendered = _render_sources(sources, replacements, destination)
+    destination = project_dir / generation_hash
+    rendered = _render_sources(templates, replacements, destination)
     outputs = {name: content.encode("utf-8") for name, content in rendered.items()}
     output_hashes = {name: _hash_bytes(content) for name, content in outputs.items()}
     manifest = {
@@ -376,21 +748,440 @@ def render(project_root: Path, skill_dir: Path) -> Path:
         "inputs": identity,
         "outputs": output_hashes,
     }
-    _publish(destination, outputs, manifest)
-    return destination / "workflow.md"
+    _publish(destination, outputs, manifest, trust_objects=not verify)
+    render_root = project_root / "_bmad" / "render"
+    with _locked(render_root / ".dependencies.lock"):
+        # Garbage collection holds this lock too: a reused generation it removed
+        # before we got here is published again before it is recorded as live.
+        if not destination.is_dir():
+            _publish(destination, outputs, manifest, trust_objects=not verify)
+        _record_dependencies(
+            project_root, destination, skill_dir, replacements, input_values
+        )
+        _write_index(index_path, skill_dir, destination, inputs)
+    return destination / "workflow.md", False
+
+
+def _init_worker(central: CentralSnapshot) -> None:
+    global _shared_central
+    _shared_central = central
+
+
+def _render_one(project_root: Path, skill_dir: Path, verify: bool) -> tuple[str, str, float]:
+    started = time.perf_counter()
+    try:
+        entry, indexed = _render(
+            project_root, skill_dir, verify=verify, central=_shared_central
+        )
+    except _HALT_ERRORS as error:
+        return "HALT", str(error), (time.perf_counter() - started) * 1000
+    status = "indexed" if indexed else "rendered"
+    return status, str(entry), (time.perf_counter() - started) * 1000
+
+
+def batch_skills(skills_root: Path, names: list[str] | None) -> list[Path]:
+    """Named skills under ``skills_root``, or every skill there with a workflow.md."""
+    if names is not None:
+        return [skills_root / name for name in names]
+    return sorted(
+        path for path in skills_root.iterdir() if (path / "workflow.md").is_file()
+    )
+
+
+def render_batch(
+    project_root: Path, skill_dirs: list[Path], *, verify: bool = False, jobs: int | None = None
+) -> list[tuple[str, str, float]]:
+    """Render many skills against one central config load; one (status, detail, ms) per skill.
+
+    Each skill publishes through the same atomic rename as ``render``. A skill
+    that cannot render reports HALT without stopping the others.
+    """
+    project_root = project_root.resolve(strict=True)
+    if not (project_root / "_bmad").is_dir():
+        raise RenderError(f"project root does not contain _bmad/: {project_root}")
+    central = _central_snapshot(project_root)
+    jobs = min(jobs or os.cpu_count() or 1, len(skill_dirs))
+    arguments = (
+        [project_root] * len(skill_dirs),
+        skill_dirs,
+        [verify] * len(skill_dirs),
+    )
+    if jobs <= 1:
+        _init_worker(central)
+        return list(map(_render_one, *arguments))
+    with ProcessPoolExecutor(
+        max_workers=jobs, initializer=_init_worker, initargs=(central,)
+    ) as pool:
+        return list(pool.map(_render_one, *arguments))
+
+
+def changed_config_skills(project_root: Path) -> tuple[list[Path], list[str]]:
+    """Skills whose live generation consumed a config value that has since changed.
+
+    Walks the reverse key -> generations map written by every full render.
+    Each central key is re-resolved once against freshly loaded config; each
+    customization key against its own skill's layers. A key changed when its
+    value differs from the recorded one or no longer resolves, and a short
+    token changed when it now names a different or ambiguous leaf. Returns the
+    affected skill directories and the changed keys.
+    """
+    project_root = project_root.resolve(strict=True)
+    render_root = project_root / "_bmad" / "render"
+    dependencies = _load_dependencies(render_root, project_root)
+    if dependencies is None:
+        raise RenderError(
+            f"no render dependency index at {render_root / _DEPENDENCIES_NAME}; "
+            "run --all --verify once to build it"
+        )
+    generations = dependencies["generations"]
+    central = load_central_config(project_root)
+    leaves, paths = _index_config(central)
+    unresolved = object()
+    layers: dict[str, tuple[dict[str, Any], dict[str, Any]] | None] = {}
+
+    def customization_value(skill_dir: str, key: str) -> Any:
+        if skill_dir not in layers:
+            try:
+                layers[skill_dir] = (
+                    load_customization(project_root, Path(skill_dir)),
+                    load_skill_defaults(Path(skill_dir)),
+                )
+            except _HALT_ERRORS:
+                layers[skill_dir] = None
+        if layers[skill_dir] is None:
+            return unresolved
+        customization, defaults = layers[skill_dir]
+        path = key.removeprefix("customization.")
+        try:
+            return _resolve_customization_value(
+                _lookup(customization, path, "customization value"),
+                _lookup(defaults, path, "customization default"),
+                key,
+            )[0]
+        except _HALT_ERRORS:
+            return unresolved
+
+    changed: set[str] = set()
+    affected: set[str] = set()
+    for key, names in dependencies.get("keys", {}).items():
+        if key.startswith("config."):
+            try:
+                value = _config_value(central, paths, key.removeprefix("config."), project_root)
+            except _HALT_ERRORS:
+                value = unresolved
+        for name in names:
+            generation = generations[name]
+            if not key.startswith("config."):
+                value = customization_value(generation["skill_dir"], key)
+            if generation["resolved_values"].get(key, unresolved) != value:
+                changed.add(key)
+                affected.add(name)
+    for name, generation in generations.items():
+        for key in generation["short_keys"]:
+            matches = leaves.get(key, [])
+            if len(matches) != 1 or f"config.{matches[0][0]}" not in generation["resolved_values"]:
+                changed.add(f"{{{{.{key}}}}}")
+                affected.add(name)
+    skill_dirs = sorted({Path(generations[name]["skill_dir"]) for name in affected})
+    return skill_dirs, sorted(changed)
+
+
+def _project_dirs(render_root: Path) -> list[Path]:
+    """Every ``<skill>/<slug>-<roothash>`` directory, skipping the object store."""
+    return sorted(
+        path
+        for path in render_root.glob("*/*")
+        if path.parent.name != _OBJECTS_NAME and path.is_dir()
+    )
+
+
+def _tree_usage(path: Path) -> tuple[int, int, list[int]]:
+    """Bytes and inodes only ``path`` holds, plus the inodes it shares by hardlink."""
+    size, inodes, shared = 0, 1, []
+    for directory, subdirectories, files in os.walk(path):
+        inodes += len(subdirectories)
+        for name in files:
+            try:
+                stat = os.lstat(os.path.join(directory, name))
+            except OSError:
+                continue
+            if stat.st_nlink > 1:
+                shared.append(stat.st_ino)
+            else:
+                size += stat.st_size
+                inodes += 1
+    return size, inodes, shared
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description=__doc__)
+def _live_generations(render_root: Path, project_root: Path) -> set[Path]:
+    """Generations a published workflow.md path may still point to.
+
+    That is the generation each project directory's input index names, every
+    generation the dependency index records, and, for project directories
+    rendered before the input index existed, their newest generation.
+    """
+    live: set[Path] = set()
+    dependencies = _load_dependencies(render_root, project_root) or {}
+    for name, generation in dependencies.get("generations", {}).items():
+        live.add(render_root / name / generation["generation"])
+    for project_dir in _project_dirs(render_root):
+        try:
+            generation = json.loads((project_dir / _INDEX_NAME).read_text(encoding="utf-8"))[
+                "generation"
+            ]
+        except (OSError, UnicodeError, ValueError, KeyError, TypeError):
+            generation = None
+        if isinstance(generation, str) and _GENERATION_HASH.fullmatch(generation):
+            live.add(project_dir / generation)
+            continue
+        newest = max(
+            (path for path in project_dir.iterdir() if _GENERATION_HASH.fullmatch(path.name)),
+            key=lambda path: path.stat().st_mtime,
+            default=None,
+        )
+        if newest is not None:
+            live.add(newest)
+    return live
+
+
+def collect_garbage(
+    project_root: Path,
+    *,
+    keep: int | None = None,
+    max_age: float | None = None,
+    max_bytes: int | None = None,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    """Remove superseded generations under ``_bmad/render`` by policy.
+
+    A generation is removed when it is beyond the newest ``keep`` of its skill
+    and project, or older than ``max_age`` seconds; then, while the render tree
+    (generations plus referenced store objects) is still larger than
+    ``max_bytes``, the oldest remaining ones go first. Live generations (see
+    ``_live_generations``) and anything published after collection started are
+    never removed. Store objects no generation links to any more, and staging
+    directories abandoned for over an hour, are removed too.
+    """
+    project_root = project_root.resolve(strict=True)
+    render_root = project_root / "_bmad" / "render"
+    objects_dir = render_root / _OBJECTS_NAME
+    started = time.time()
+    result: dict[str, Any] = {
+        "removed": [],
+        "staging": [],
+        "objects": 0,
+        "kept": 0,
+        "live": 0,
+        "bytes": 0,
+        "inodes": 0,
+    }
+    if not render_root.is_dir():
+        return result
+    with _locked(render_root / ".dependencies.lock"):
+        live = _live_generations(render_root, project_root)
+        # inode -> [links, bytes, path, mtime] for every store object.
+        store: dict[int, list[Any]] = {}
+        for path in objects_dir.glob("*/*"):
+            if path.name.endswith(_OBJECT_STAT_SUFFIX):
+                continue
+            with contextlib.suppress(OSError):
+                stat = path.lstat()
+                store[stat.st_ino] = [stat.st_nlink, stat.st_size, path, stat.st_mtime]
+        total = sum(size for links, size, _, _ in store.values() if links > 1)
+        removed: list[tuple[Path, int, int]] = []
+        candidates: list[tuple[float, Path, int, int, list[int]]] = []
+
+        def drop(path: Path, size: int, inodes: int, shared: list[int]) -> None:
+            nonlocal total
+            removed.append((path, size, inodes))
+            total -= size
+            for inode in shared:
+                if inode in store:
+                    store[inode][0] -= 1
+                    if store[inode][0] == 1:
+                        total -= store[inode][1]
+
+        for project_dir in _project_dirs(render_root):
+            generations = []
+            for path in project_dir.iterdir():
+                if _GENERATION_HASH.fullmatch(path.name) and path.is_dir():
+                    size, inodes, shared = _tree_usage(path)
+                    total += size
+                    generations.append((path.stat().st_mtime, path, size, inodes, shared))
+            generations.sort(key=lambda generation: generation[0], reverse=True)
+            for rank, (mtime, path, size, inodes, shared) in enumerate(generations):
+                if path in live or mtime >= started:
+                    result["kept"] += 1
+                elif (keep is not None and rank >= keep) or (
+                    max_age is not None and started - mtime > max_age
+                ):
+                    drop(path, size, inodes, shared)
+                else:
+                    candidates.append((mtime, path, size, inodes, shared))
+        candidates.sort(key=lambda generation: generation[0])
+        while max_bytes is not None and candidates and total > max_bytes:
+            drop(*candidates.pop(0)[1:])
+        result["kept"] += len(candidates)
+        staging = [
+            (path, *_tree_usage(path)[:2])
+            for path in render_root.glob("*/*/.staging-*")
+            if path.is_dir() and started - path.stat().st_mtime > 3600
+        ]
+        if not dry_run:
+            for path, _, _ in removed + staging:
+                shutil.rmtree(path, ignore_errors=True)
+        # Objects only the store still links to; a render that loses its object
+        # to this race falls back to writing a private copy.
+        for links, size, path, mtime in store.values():
+            if mtime >= started:
+                continue
+            if not dry_run:
+                try:
+                    links = path.lstat().st_nlink
+                    if links == 1:
+                        path.unlink()
+                        path.with_name(path.name + _OBJECT_STAT_SUFFIX).unlink(missing_ok=True)
+                except OSError:
+                    continue
+            if links == 1:
+                result["objects"] += 1
+                result["bytes"] += size
+                result["inodes"] += 1
+    result["removed"] = [path for path, _, _ in removed]
+    result["staging"] = [path for path, _, _ in staging]
+    result["live"] = len(live)
+    result["bytes"] += sum(size for _, size, _ in removed + staging)
+    result["inodes"] += sum(inodes for _, _, inodes in removed + staging)
+    return result
+
+
+def _parse_size(text: str) -> int:
+    units = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+    match = re.fullmatch(r"(\d+)([KMG]?)i?B?", text.strip(), re.IGNORECASE)
+    if match is None:
+        raise argparse.ArgumentTypeError(f"invalid size: {text}")
+    return int(match.group(1)) * units[match.group(2).upper()]
+
+
+def _gc_main(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(
+        prog="render_skill.py gc",
+        description="Remove superseded render generations; live ones are always kept.",
+    )
     parser.add_argument("--project-root", required=True)
-    parser.add_argument("--skill", required=True)
-    args = parser.parse_args()
+    parser.add_argument(
+        "--keep", type=int, help="keep the newest N generations per skill and project"
+    )
+    parser.add_argument(
+        "--max-age", type=float, metavar="DAYS", help="remove generations older than DAYS"
+    )
+    parser.add_argument(
+        "--max-bytes",
+        type=_parse_size,
+        metavar="SIZE",
+        help="then remove the oldest until the render tree fits SIZE (e.g. 200M)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="report without removing")
+    args = parser.parse_args(argv)
+    if args.keep is None and args.max_age is None and args.max_bytes is None:
+        parser.error("choose at least one of --keep, --max-age, --max-bytes")
+    if args.keep is not None and args.keep < 1:
+        parser.error("--keep must be at least 1")
+    try:
+        result = collect_garbage(
+            Path(args.project_root),
+            keep=args.keep,
+            max_age=None if args.max_age is None else args.max_age * 86400,
+            max_bytes=args.max_bytes,
+            dry_run=args.dry_run,
+        )
+    except _HALT_ERRORS as error:
+        sys.stdout.write(f"HALT: {error}\n")
+        return 1
+    verb = "would remove" if args.dry_run else "removed"
+    for path in result["removed"] + result["staging"]:
+        sys.stdout.write(f"{verb} {path}\n")
+    sys.stdout.write(
+        f"{verb} {len(result['removed'])} generation(s), {result['objects']} object(s) and "
+        f"{len(result['staging'])} staging dir(s): {result['bytes']} bytes, "
+        f"{result['inodes']} inodes reclaimed; kept {result['kept']} "
+        f"({result['live']} live)\n"
+    )
+    return 0
+
+
+def _write_batch_table(skill_dirs: list[Path], results: list[tuple[str, str, float]]) -> None:
+    width = max([len("skill"), *(len(path.name) for path in skill_dirs)])
+    sys.stdout.write(f"{'skill':<{width}}  {'status':<8}  {'ms':>8}  detail\n")
+    for path, (status, detail, elapsed) in zip(skill_dirs, results):
+        sys.stdout.write(f"{path.name:<{width}}  {status:<8}  {elapsed:>8.1f}  {detail}\n")
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
     reconfigure = getattr(sys.stdout, "reconfigure", None)
     if reconfigure is not None:
         reconfigure(encoding="utf-8")
+    if argv[:1] == ["gc"]:
+        return _gc_main(argv[1:])
+    parser = argparse.ArgumentParser(
+        description=__doc__, epilog="Run `render_skill.py gc --help` to prune old generations."
+    )
+    parser.add_argument("--project-root", required=True)
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--skill", help="render one skill directory")
+    target.add_argument(
+        "--skills", help="comma-separated skill names (or paths) under --skills-root"
+    )
+    target.add_argument(
+        "--all", action="store_true", help="render every skill under --skills-root with a workflow.md"
+    )
+    target.add_argument(
+        "--changed-config",
+        action="store_true",
+        help="re-render only skills whose live generation consumed a changed config value",
+    )
+    parser.add_argument(
+        "--skills-root",
+        help="directory holding skills for --skills/--all (default: <project-root>/.agents/skills)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, help="render processes for --skills/--all (default: CPU count)"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="ignore the input index and re-hash the existing generation",
+    )
+    args = parser.parse_args(argv)
+    project_root = Path(args.project_root)
+    if args.skill is None:
+        skills_root = (
+            Path(args.skills_root)
+            if args.skills_root
+            else project_root / ".agents" / "skills"
+        )
+        try:
+            if args.changed_config:
+                skill_dirs, changed = changed_config_skills(project_root)
+                if not skill_dirs:
+                    sys.stdout.write("no rendered skill consumed a changed config value\n")
+                    return 0
+                sys.stdout.write(f"changed: {', '.join(changed)}\n")
+            else:
+                names = None if args.all else [name for name in args.skills.split(",") if name]
+                skill_dirs = batch_skills(skills_root, names)
+            results = render_batch(
+                project_root, skill_dirs, verify=args.verify, jobs=args.jobs
+            )
+        except _HALT_ERRORS as error:
+            sys.stdout.write(f"HALT: {error}\n")
+            return 1
+        _write_batch_table(skill_dirs, results)
+        return 1 if any(status == "HALT" for status, _, _ in results) else 0
     try:
-        entry = render(Path(args.project_root), Path(args.skill))
-    except (ConfigError, RenderError, OSError, UnicodeError, ValueError) as error:
+        entry = render(project_root, Path(args.skill), verify=args.verify)
+    except _HALT_ERRORS as error:
         sys.stdout.write(f"HALT: {error}\n")
         return 1
     sys.stdout.write(f"read and follow {entry}\n")
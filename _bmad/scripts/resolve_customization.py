@@ -2,7 +2,7 @@
 # /// script
 # requires-python = ">=3.11"
 # ///
-"""Resolve a skill's default, team, and user TOML customization layers."""
+"""Resolve one or more skills' default, team, and user TOML customization layers."""
 
 import argparse
 import json
@@ -13,7 +13,7 @@ from pathlib import Path
 sys.dont_write_bytecode = True
 
 try:
-    from config_utils import ConfigError, load_customization
+    from config_utils import ConfigError, load_customizations
 except ModuleNotFoundError as error:
     if error.name != "tomllib":
         raise
@@ -24,14 +24,26 @@ except ModuleNotFoundError as error:
 _MISSING = object()
 
 
-def find_project_root(start: Path) -> Path | None:
+def find_project_root(
+    start: Path, seen: dict[Path, Path | None] | None = None
+) -> Path | None:
+    """Nearest ancestor holding _bmad/ or .git; ``seen`` memoizes across sibling skills."""
+    seen = {} if seen is None else seen
+    walked = []
     current = start.resolve()
-    while True:
+    while current not in seen:
+        walked.append(current)
         if (current / "_bmad").exists() or (current / ".git").exists():
-            return current
+            seen[current] = current
+            break
         if current.parent == current:
-            return None
+            seen[current] = None
+            break
         current = current.parent
+    root = seen[current]
+    for path in walked:
+        seen[path] = root
+    return root
 
 
 def extract_key(data, dotted_key: str):
@@ -56,7 +68,11 @@ def main() -> int:
         description="Resolve skill customization using three-layer TOML merge."
     )
     parser.add_argument(
-        "--skill", "-s", required=True, help="Absolute path to the skill directory"
+        "--skill",
+        "-s",
+        action="append",
+        required=True,
+        help="Absolute path to a skill directory (repeatable; several emit one object keyed by skill name)",
     )
     parser.add_argument(
         "--project-root",
@@ -72,25 +88,39 @@ def main() -> int:
     )
     args = parser.parse_args()
 
-    skill_dir = Path(args.skill).resolve()
-    project_root = (
-        Path(args.project_root).resolve()
-        if args.project_root
-        else find_project_root(skill_dir) or find_project_root(Path.cwd())
-    )
+    skill_dirs = [Path(skill).resolve() for skill in args.skill]
+    names = [skill_dir.name for skill_dir in skill_dirs]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        parser.error(f"skill name given more than once: {', '.join(duplicates)}")
+    seen: dict[Path, Path | None] = {}
+    by_root: dict[Path | None, list[Path]] = {}
+    for skill_dir in skill_dirs:
+        project_root = (
+            Path(args.project_root).resolve()
+            if args.project_root
+            else find_project_root(skill_dir, seen) or find_project_root(Path.cwd(), seen)
+        )
+        by_root.setdefault(project_root, []).append(skill_dir)
+    merged = {}
     try:
-        merged = load_customization(project_root, skill_dir)
+        for project_root, group in by_root.items():
+            merged.update(load_customizations(project_root, group))
     except ConfigError as error:
         sys.stderr.write(f"error: {error}\n")
         return 1
 
-    output = merged
-    if args.key:
-        output = {}
-        for key in args.key:
-            value = extract_key(merged, key)
-            if value is not _MISSING:
-                output[key] = value
+    results = {}
+    for skill_dir in skill_dirs:
+        output = merged[skill_dir]
+        if args.key:
+            output = {}
+            for key in args.key:
+                value = extract_key(merged[skill_dir], key)
+                if value is not _MISSING:
+                    output[key] = value
+        results[skill_dir.name] = output
+    output = results[skill_dirs[0].name] if len(skill_dirs) == 1 else results
     write_json_stdout(output)
     return 0
 
@@ -4,13 +4,24 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import hashlib
 import json
+import os
 import re
+import shutil
 import subprocess
 import sys
+import threading
+import time
 import tomllib
+import xml.etree.ElementTree as ElementTree
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+from urllib.parse import unquote
 
 try:
     import yaml
@@ -33,22 +44,38 @@ FORBIDDEN_MARKERS = re.compile(
     r"(?i)(?:\bTODO\b|\bTBD\b|to be generated|coming soon|not yet generated|placeholder)"
 )
 MARKDOWN_LINK = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
+ATX_HEADING = re.compile(r"^ {0,3}#{1,6}[ \t]+(.*?)(?:[ \t]+#+)?[ \t]*$")
+HTML_ANCHOR = re.compile(r"""<a\s[^>]*?\b(?:name|id)\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+CODE_FENCE = re.compile(r"^ {0,3}(`{3,}|~{3,})")
+URL_SCHEME = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:")
+MARKDOWN_SUFFIXES = (".md", ".markdown")
 
 
 class Reporter:
-    def __init__(self) -> None:
+    def __init__(self, *, echo: bool = True) -> None:
         self.passes = 0
         self.warnings = 0
         self.failures = 0
+        self.echo = echo
+        self._lock = threading.Lock()
+
+    def emit(self, level: str, check: str, detail: str, *, cached: bool = False) -> None:
+        with self._lock:
+            if self.echo:
+                print(f"{'CACHED ' if cached else ''}{level:<4} {check}: {detail}")
+            if level == "PASS":
+                self.passes += 1
+            elif level == "WARN":
+                self.warnings += 1
+            else:
+                self.failures += 1
 
-    def emit(self, level: str, check: str, detail: str) -> None:
-        print(f"{level:<4} {check}: {detail}")
-        if level == "PASS":
-            self.passes += 1
-        elif level == "WARN":
-            self.warnings += 1
-        else:
-            self.failures += 1
+    def replay(self, buffer: BufferedReporter, *, cached: bool = False) -> None:
+        for level, check, detail in buffer.records:
+            self.emit(level, check, detail, cached=cached)
+
+    def depends_on(self, *paths: str) -> None:
+        """Record inputs discovered while checking; only buffered runs keep them."""
 
     def passed(self, check: str, detail: str) -> None:
         self.emit("PASS", check, detail)
@@ -60,17 +87,81 @@ class Reporter:
         self.emit("FAIL", check, detail)
 
 
-def load_yaml(path: Path) -> dict[str, Any]:
+class BufferedReporter(Reporter):
+    """Collects one check's results so concurrent checks never interleave output."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[tuple[str, str, str]] = []
+        self.discovered: set[str] = set()
+
+    def emit(self, level: str, check: str, detail: str, *, cached: bool = False) -> None:
+        self.records.append((level, check, detail))
+
+    def depends_on(self, *paths: str) -> None:
+        self.discovered.update(paths)
+
+
+def parse_yaml(text: str) -> dict[str, Any]:
     if yaml is None:
         raise RuntimeError("PyYAML unavailable")
-    with path.open(encoding="utf-8") as handle:
-        value = yaml.safe_load(handle) or {}
+    value = yaml.safe_load(text) or {}
     if not isinstance(value, dict):
         raise ValueError("expected a YAML mapping")
     return value
 
 
-def check_root_artifacts(source: Path, docs: Path, report: Reporter) -> None:
+_MISSING = object()
+
+
+class ArtifactCache:
+    """Per-run cache of file text and parsed values, keyed by path and stat fingerprint.
+
+    Parsed values are layered on the cached text, so a file read as text by one
+    check and parsed as YAML by another is only read once. Cached values are
+    shared between concurrent checks and must be treated as read-only.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[tuple[Path, str], tuple[tuple[int, int, int], Any]] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, path: Path, kind: str, parse: Callable[[Path], Any]) -> Any:
+        stat = path.stat()
+        fingerprint = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        key = (path, kind)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                self.hits += 1
+                return cached[1]
+        value = parse(path)
+        with self._lock:
+            self.misses += 1
+            self._entries[key] = (fingerprint, value)
+        return value
+
+    def text(self, path: Path, default: Any = _MISSING) -> str:
+        if default is not _MISSING and not path.is_file():
+            return default
+        return self._load(path, "text", lambda item: item.read_text(encoding="utf-8"))
+
+    def yaml(self, path: Path) -> dict[str, Any]:
+        return self._load(path, "yaml", lambda item: parse_yaml(self.text(item)))
+
+    def toml(self, path: Path) -> dict[str, Any]:
+        return self._load(path, "toml", lambda item: tomllib.loads(self.text(item)))
+
+    def json(self, path: Path) -> Any:
+        return self._load(path, "json", lambda item: json.loads(self.text(item)))
+
+    def summary(self) -> str:
+        return f"CACHE hits={self.hits} misses={self.misses} artifacts={len(self._entries)}"
+
+
+def check_root_artifacts(source: Path, docs: Path, cache: ArtifactCache, report: Reporter) -> None:
     missing = [name for name in REQUIRED_ROOT_DOCS if not (docs / name).is_file()]
     if missing:
         report.fail("root-docs", f"missing required files under {docs}: {', '.join(missing)}")
@@ -86,7 +177,7 @@ def check_root_artifacts(source: Path, docs: Path, report: Reporter) -> None:
         report.warn("root-bmad", "PyYAML unavailable; files exist but YAML parsing was skipped")
     else:
         try:
-            core, bmm = (load_yaml(path) for path in required_configs)
+            core, bmm = (cache.yaml(path) for path in required_configs)
             expected = {
                 "project_name": "33GOD",
                 "user_name": "Jarad",
@@ -105,12 +196,12 @@ def check_root_artifacts(source: Path, docs: Path, report: Reporter) -> None:
             report.fail("root-bmad", f"YAML parse failed: {exc}")
 
 
-def check_part_declaration(source: Path, docs: Path, report: Reporter) -> None:
+def check_part_declaration(source: Path, docs: Path, cache: ArtifactCache, report: Reporter) -> None:
     path = docs / "project-parts.json"
     if not path.is_file():
         return
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = cache.json(path)
         ids = tuple(item["id"] for item in data["parts"])
     except (OSError, ValueError, KeyError, TypeError) as exc:
         report.fail("four-part-scope", f"cannot parse declaration: {exc}")
@@ -127,7 +218,7 @@ def check_part_declaration(source: Path, docs: Path, report: Reporter) -> None:
         report.passed("component-roots", "all four live component roots exist")
 
 
-def check_component_bmad(source: Path, docs: Path, report: Reporter) -> None:
+def check_component_bmad(source: Path, docs: Path, cache: ArtifactCache, report: Reporter) -> None:
     for part in PARTS:
         root = source / part
         configs = (root / "_bmad/core/config.yaml", root / "_bmad/bmm/config.yaml")
@@ -143,8 +234,8 @@ def check_component_bmad(source: Path, docs: Path, report: Reporter) -> None:
             report.warn(f"component-{part}", "artifacts exist; PyYAML unavailable for config semantics")
             continue
         try:
-            core = load_yaml(configs[0])
-            bmm = load_yaml(configs[1])
+            core = cache.yaml(configs[0])
+            bmm = cache.yaml(configs[1])
             problems = []
             if not isinstance(core.get("project_name"), str) or not core.get("project_name"):
                 problems.append(f"core project_name={core.get('project_name')!r}")
@@ -155,8 +246,7 @@ def check_component_bmad(source: Path, docs: Path, report: Reporter) -> None:
             if problems:
                 report.fail(f"component-{part}", "malformed or unresolved BMAD config: " + ", ".join(problems))
             elif (config_toml := root / "_bmad/config.toml").is_file():
-                with config_toml.open("rb") as handle:
-                    canonical = tomllib.load(handle)
+                canonical = cache.toml(config_toml)
                 canonical_name = canonical.get("core", {}).get("project_name")
                 if canonical_name != core.get("project_name"):
                     report.fail(
@@ -171,7 +261,7 @@ def check_component_bmad(source: Path, docs: Path, report: Reporter) -> None:
             report.fail(f"component-{part}", f"config parse failed: {exc}")
 
 
-def check_platform_manifest(source: Path, report: Reporter) -> None:
+def check_platform_manifest(source: Path, cache: ArtifactCache, report: Reporter) -> None:
     platform = source / "33god-platform"
     component_paths = {part: platform / "components" / f"{part}.yaml" for part in PARTS}
     if yaml is None:
@@ -182,7 +272,7 @@ def check_platform_manifest(source: Path, report: Reporter) -> None:
             report.fail(f"platform-{part}", f"missing {path}")
             continue
         try:
-            item = load_yaml(path)
+            item = cache.yaml(path)
             declared = (platform / str(item["repo"])).resolve()
             expected = (source / part).resolve()
             if declared != expected:
@@ -192,7 +282,7 @@ def check_platform_manifest(source: Path, report: Reporter) -> None:
         except Exception as exc:
             report.fail(f"platform-{part}", f"manifest parse/parity failed: {exc}")
 
-    pjangler_text = component_paths["pjangler"].read_text(encoding="utf-8")
+    pjangler_text = cache.text(component_paths["pjangler"])
     if "bun test" in pjangler_text:
         report.fail("pjangler-health", "platform health uses Bun, but live project is npm-based")
     elif "npm test" in pjangler_text:
@@ -206,9 +296,9 @@ def function_block(text: str, name: str) -> str:
     return match.group(0) if match else ""
 
 
-def check_high_risk_contracts(source: Path, report: Reporter) -> None:
+def check_high_risk_contracts(source: Path, cache: ArtifactCache, report: Reporter) -> None:
     validator = source / "bloodbank/services/agent-hooks/core/validate.py"
-    text = validator.read_text(encoding="utf-8") if validator.is_file() else ""
+    text = cache.text(validator, "")
     block = function_block(text, "assert_contract")
     if "assert_subject_matches(" in block:
         report.passed("bloodbank-subject-binding", "runtime contract invokes semantic subject/type equality")
@@ -217,28 +307,28 @@ def check_high_risk_contracts(source: Path, report: Reporter) -> None:
 
     heartbeat = source / "bloodbank/services/heartbeat-recorder"
     compose = source / "bloodbank/compose/docker-compose.yml"
-    compose_text = compose.read_text(encoding="utf-8") if compose.is_file() else ""
+    compose_text = cache.text(compose, "")
     if "services/heartbeat-recorder" in compose_text and not heartbeat.is_dir():
         report.fail("bloodbank-heartbeat", "Compose references missing services/heartbeat-recorder")
     else:
         report.passed("bloodbank-heartbeat", "heartbeat build context is internally consistent")
 
     candy_compose = source / "candystore/compose.yml"
-    candy_text = candy_compose.read_text(encoding="utf-8") if candy_compose.is_file() else ""
-    if "MUTUAL EXCLUSION" in candy_text and "candystore-events" in (source / "candystore/dapr-components/pubsub.yaml").read_text(encoding="utf-8"):
+    candy_text = cache.text(candy_compose, "")
+    if "MUTUAL EXCLUSION" in candy_text and "candystore-events" in cache.text(source / "candystore/dapr-components/pubsub.yaml"):
         report.passed("candystore-deployment-mode", "standalone manifest declares legacy-profile mutual exclusion")
     else:
         report.fail("candystore-deployment-mode", "mutual-exclusion declaration or durable identity is missing")
 
     fleet = source / "holocene/apps/api/src/fleet.ts"
-    fleet_text = fleet.read_text(encoding="utf-8") if fleet.is_file() else ""
+    fleet_text = cache.text(fleet, "")
     if '"http://candystore:8080"' in fleet_text:
         report.fail("holocene-candystore-url", "default URL contradicts standalone Candystore port/topology")
     else:
         report.passed("holocene-candystore-url", "default history URL no longer uses candystore:8080")
 
     consumer = source / "pjangler/templates/hermes-agent/runtime-scaffold/bloodbank-consumer.py"
-    consumer_text = consumer.read_text(encoding="utf-8") if consumer.is_file() else ""
+    consumer_text = cache.text(consumer, "")
     noncanonical = re.search(
         r"bloodbank\.(?:evt\.v1\.repo|cmd\.v1\.agent)\."
         r"(?:\{(?:REPO|AGENT_ID)\}|\{\{[^}]+\}\}|<(?:repo|agent_id)>)",
@@ -275,21 +365,112 @@ def check_compose_candidate(source: Path, docs_checkout: Path, report: Reporter)
         report.passed("root-compose", detail)
 
 
-def check_docs(docs: Path, report: Reporter) -> None:
+def heading_slug(text: str) -> str:
+    """GitHub-style anchor slug for an ATX heading's text."""
+    text = re.sub(r"<[^>]+>", "", text)
+    text = re.sub(r"!?\[([^\]]*)\]\([^)]*\)", r"\1", text)
+    text = re.sub(r"[^\w\- ]", "", text.strip().lower())
+    return text.replace(" ", "-")
+
+
+def link_target(raw: str) -> str:
+    """Strip an optional ``<...>`` wrapper and ``"title"`` from a link destination."""
+    raw = raw.strip()
+    if raw.startswith("<"):
+        return raw[1:].split(">", 1)[0]
+    return raw.split(maxsplit=1)[0] if raw else ""
+
+
+class LinkChecker:
+    """Scans each Markdown file once for links and heading anchors.
+
+    Anchor indexes are built lazily per target file and path existence is
+    memoised per normalized destination, so a link target shared by many
+    documents costs one stat no matter how often it is referenced.
+    """
+
+    def __init__(self, cache: ArtifactCache) -> None:
+        self.cache = cache
+        self.links = 0
+        self.fragments = 0
+        self._scans: dict[Path, tuple[list[str], frozenset[str]]] = {}
+        self._exists: dict[str, bool] = {}
+
+    def scan(self, path: Path) -> tuple[list[str], frozenset[str]]:
+        if path in self._scans:
+            return self._scans[path]
+        links: list[str] = []
+        anchors: set[str] = set()
+        seen: dict[str, int] = {}
+        fence = ""
+        # Links are matched per fence-free span, not per line: link text may wrap.
+        span: list[str] = []
+        for line in self.cache.text(path).splitlines():
+            opener = CODE_FENCE.match(line)
+            if opener and (not fence or opener.group(1).startswith(fence)):
+                if not fence:
+                    links.extend(MARKDOWN_LINK.findall("\n".join(span)))
+                    span = []
+                fence = "" if fence else opener.group(1)
+                continue
+            if fence:
+                continue
+            span.append(line)
+            if heading := ATX_HEADING.match(line):
+                slug = heading_slug(heading.group(1))
+                count = seen.get(slug, 0)
+                seen[slug] = count + 1
+                anchors.add(f"{slug}-{count}" if count else slug)
+            anchors.update(HTML_ANCHOR.findall(line))
+        links.extend(MARKDOWN_LINK.findall("\n".join(span)))
+        self._scans[path] = (links, frozenset(anchors))
+        return self._scans[path]
+
+    @property
+    def destinations(self) -> list[str]:
+        return list(self._exists)
+
+    def exists(self, destination: str) -> bool:
+        if destination not in self._exists:
+            self._exists[destination] = os.path.exists(destination)
+        return self._exists[destination]
+
+    def broken(self, path: Path) -> list[str]:
+        problems = []
+        links, anchors = self.scan(path)
+        for raw in links:
+            target = link_target(raw)
+            if not target or URL_SCHEME.match(target):
+                continue
+            self.links += 1
+            clean, _, fragment = target.partition("#")
+            clean, fragment = unquote(clean), unquote(fragment)
+            destination = os.path.normpath(os.path.join(path.parent, clean)) if clean else str(path)
+            if not self.exists(destination):
+                problems.append(raw)
+                continue
+            if not fragment or not destination.endswith(MARKDOWN_SUFFIXES) or os.path.isdir(destination):
+                continue
+            self.fragments += 1
+            target_anchors = anchors if destination == str(path) else self.scan(Path(destination))[1]
+            if fragment not in target_anchors and fragment.lower() not in target_anchors:
+                problems.append(raw)
+        return problems
+
+
+def check_docs(docs: Path, source: Path, cache: ArtifactCache, report: Reporter, *, component_docs: bool = False) -> None:
     markdown = sorted(docs.glob("*.md"))
-    marker_hits = []
+    linked = list(markdown)
+    if component_docs:
+        for part in PARTS:
+            linked.extend(sorted((source / part / "docs").rglob("*.md")))
+    marker_hits = [path.name for path in markdown if FORBIDDEN_MARKERS.search(cache.text(path))]
+    checker = LinkChecker(cache)
     broken = []
-    for path in markdown:
-        text = path.read_text(encoding="utf-8")
-        if FORBIDDEN_MARKERS.search(text):
-            marker_hits.append(path.name)
-        for target in MARKDOWN_LINK.findall(text):
-            clean = target.split("#", 1)[0]
-            if not clean or clean.startswith(("http://", "https://", "mailto:")):
-                continue
-            destination = (path.parent / clean).resolve()
-            if not destination.exists():
-                broken.append(f"{path.name} -> {target}")
+    for path in linked:
+        label = path.name if path.parent == docs else os.path.relpath(path, source)
+        broken.extend(f"{label} -> {target}" for target in checker.broken(path))
+    report.depends_on(*checker.destinations)
     if marker_hits:
         report.fail("doc-markers", "incomplete markers in: " + ", ".join(marker_hits))
     else:
@@ -297,7 +478,357 @@ def check_docs(docs: Path, report: Reporter) -> None:
     if broken:
         report.fail("doc-links", "broken internal links: " + "; ".join(broken))
     else:
-        report.passed("doc-links", "all Markdown file links resolve")
+        report.passed(
+            "doc-links",
+            f"all {checker.links} internal links in {len(linked)} Markdown files resolve "
+            f"({checker.fragments} anchors verified)",
+        )
+
+
+@dataclass(frozen=True)
+class Check:
+    """One independent check and every input that determines its result.
+
+    ``inputs`` are ``(root, glob)`` pairs, ``executables`` are programs the check
+    runs as subprocesses, and ``environment`` lists variable-name prefixes those
+    subprocesses read.
+    """
+
+    name: str
+    run: Callable[[Reporter], None]
+    inputs: tuple[tuple[Path, str], ...] = ()
+    executables: tuple[str, ...] = ()
+    environment: tuple[str, ...] = ()
+
+
+def stat_token(path: str) -> str:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return f"{path}\0-"
+    return f"{path}\0{stat.st_ino}\0{stat.st_size}\0{stat.st_mtime_ns}"
+
+
+class DriftState:
+    """Persisted per-check fingerprints and last passing results.
+
+    A fingerprint covers the stat of every declared input, the resolved
+    executables, the relevant environment, and any paths the check reported
+    through ``depends_on`` on its last run. Only all-PASS results are stored, so
+    warnings and failures are always re-evaluated.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path: Path, salt: str) -> None:
+        self.path = path
+        self.salt = salt
+        self._lock = threading.Lock()
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        valid = isinstance(data, dict) and data.get("version") == self.VERSION and data.get("salt") == salt
+        self.checks: dict[str, dict[str, Any]] = data.get("checks", {}) if valid else {}
+
+    @staticmethod
+    def input_files(check: Check) -> list[str]:
+        """Declared input paths; a glob with no matches yields its literal path."""
+        files = []
+        for root, pattern in check.inputs:
+            matches = sorted(str(path) for path in root.glob(pattern))
+            files.extend(matches or [str(root / pattern)])
+        return files
+
+    @classmethod
+    def declared(cls, check: Check) -> list[str]:
+        tokens = [stat_token(path) for path in cls.input_files(check)]
+        for name in check.executables:
+            executable = shutil.which(name)
+            tokens.append(stat_token(executable) if executable else f"{name}\0-")
+        tokens.extend(
+            f"{key}={value}"
+            for key, value in sorted(os.environ.items())
+            if key.startswith(check.environment)
+        )
+        return tokens
+
+    def fingerprint(self, check: Check, declared: list[str], discovered: list[str]) -> str:
+        payload = "\n".join([self.salt, check.name, *declared, *map(stat_token, discovered)])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(self, check: Check) -> BufferedReporter | None:
+        entry = self.checks.get(check.name)
+        if not entry:
+            return None
+        discovered = entry.get("discovered", [])
+        if entry.get("fingerprint") != self.fingerprint(check, self.declared(check), discovered):
+            return None
+        buffer = BufferedReporter()
+        buffer.records = [tuple(record) for record in entry.get("records", [])]
+        buffer.discovered = set(discovered)
+        return buffer
+
+    def record(self, check: Check, declared: list[str], buffer: BufferedReporter) -> None:
+        with self._lock:
+            if not buffer.records or any(level != "PASS" for level, _, _ in buffer.records):
+                self.checks.pop(check.name, None)
+                return
+            discovered = sorted(buffer.discovered)
+            self.checks[check.name] = {
+                "fingerprint": self.fingerprint(check, declared, discovered),
+                "discovered": discovered,
+                "records": buffer.records,
+            }
+
+    def save(self) -> None:
+        payload = {"version": self.VERSION, "salt": self.salt, "checks": self.checks}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temporary = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            temporary.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+            os.replace(temporary, self.path)
+        except OSError as exc:
+            print(f"WARN drift state not saved: {exc}", file=sys.stderr)
+
+
+@dataclass
+class CheckResult:
+    name: str
+    buffer: BufferedReporter
+    cached: bool
+    duration_s: float
+    inputs: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "cached": self.cached,
+            "duration_s": round(self.duration_s, 6),
+            "inputs": self.inputs,
+            "results": [
+                {"level": level, "check": check, "detail": detail} for level, check, detail in self.buffer.records
+            ],
+        }
+
+
+def evaluate(check: Check, state: DriftState, force: bool) -> CheckResult:
+    started = time.perf_counter()
+    cached = None if force else state.lookup(check)
+    if cached is None:
+        declared = state.declared(check)
+        buffer = BufferedReporter()
+        check.run(buffer)
+        state.record(check, declared, buffer)
+    else:
+        buffer = cached
+    duration = time.perf_counter() - started
+    inputs = sorted({path for path in state.input_files(check) if os.path.exists(path)} | buffer.discovered)
+    return CheckResult(check.name, buffer, cached is not None, duration, inputs)
+
+
+def run_checks(checks: list[Check], report: Reporter, state: DriftState, *, jobs: int, force: bool) -> list[CheckResult]:
+    """Run independent checks concurrently and report their results in declaration order.
+
+    ``root-compose`` is submitted first: its validator subprocess renders four
+    Docker models and dominates wall time, so the pure-Python checks overlap it.
+    Checks whose fingerprint matches the persisted state replay their last
+    result instead of running.
+    """
+    submission = sorted(checks, key=lambda check: check.name != "root-compose")
+    results = []
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = {check.name: pool.submit(evaluate, check, state, force) for check in submission}
+        for check in checks:
+            result = futures[check.name].result()
+            report.replay(result.buffer, cached=result.cached)
+            results.append(result)
+    state.save()
+    return results
+
+
+def json_report(results: list[CheckResult], report: Reporter, cache: ArtifactCache, meta: dict[str, Any]) -> str:
+    payload = {
+        **meta,
+        "summary": {"pass": report.passes, "warn": report.warnings, "fail": report.failures},
+        "cache": {"hits": cache.hits, "misses": cache.misses},
+        "checks": [result.as_dict() for result in results],
+    }
+    return json.dumps(payload, indent=2)
+
+
+def junit_report(results: list[CheckResult], report: Reporter, meta: dict[str, Any]) -> str:
+    """One <testsuite> per check and one <testcase> per result; WARN maps to <skipped>."""
+    suites = ElementTree.Element(
+        "testsuites",
+        name="33god-doc-drift",
+        tests=str(report.passes + report.warnings + report.failures),
+        failures=str(report.failures),
+        skipped=str(report.warnings),
+        time=f"{meta['duration_s']:.6f}",
+    )
+    for result in results:
+        records = result.buffer.records
+        suite = ElementTree.SubElement(
+            suites,
+            "testsuite",
+            name=result.name,
+            tests=str(len(records)),
+            failures=str(sum(level == "FAIL" for level, _, _ in records)),
+            skipped=str(sum(level == "WARN" for level, _, _ in records)),
+            time=f"{result.duration_s:.6f}",
+        )
+        properties = ElementTree.SubElement(suite, "properties")
+        ElementTree.SubElement(properties, "property", name="cached", value=str(result.cached).lower())
+        for path in result.inputs:
+            ElementTree.SubElement(properties, "property", name="input", value=path)
+        for level, check, detail in records:
+            case = ElementTree.SubElement(suite, "testcase", classname=result.name, name=check)
+            if level == "FAIL":
+                ElementTree.SubElement(case, "failure", message=detail)
+            elif level == "WARN":
+                ElementTree.SubElement(case, "skipped", message=detail)
+    ElementTree.indent(suites)
+    return '<?xml version="1.0" encoding="UTF-8"?>\n' + ElementTree.tostring(suites, encoding="unicode")
+
+
+def staged_paths(checkout: Path) -> list[str] | None:
+    """Absolute paths staged in ``checkout``'s repository, or None outside git."""
+    try:
+        toplevel = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"], cwd=checkout, text=True, capture_output=True, check=True
+        ).stdout.strip()
+        names = subprocess.run(
+            ["git", "diff", "--cached", "--name-only", "-z", "--diff-filter=ACDMR"],
+            cwd=checkout,
+            text=True,
+            capture_output=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return [os.path.join(toplevel, name) for name in names.split("\0") if name]
+
+
+def touches(path: str, pattern: str) -> bool:
+    """A staged path touches an input it matches, lies beneath, or contains.
+
+    Submodules stage only their gitlink, and a directory input holds whatever
+    is staged below it, so an exact match alone misses both.
+    """
+    return (
+        fnmatch.fnmatch(path, pattern)
+        or fnmatch.fnmatch(path, f"{pattern}/*")
+        or pattern.startswith(f"{path}/")
+    )
+
+
+def affected_checks(checks: list[Check], paths: list[str], state: DriftState) -> list[Check]:
+    """Checks whose declared or previously discovered inputs a staged path touches.
+
+    A staged change to this script affects every check.
+    """
+    if str(Path(__file__).resolve()) in paths:
+        return list(checks)
+    selected = []
+    for check in checks:
+        patterns = [str(root / pattern) for root, pattern in check.inputs]
+        patterns.extend(pattern.replace("**/", "") for pattern in patterns if "**/" in pattern)
+        discovered = set(state.checks.get(check.name, {}).get("discovered", []))
+        if any(
+            path in discovered
+            or any(found.startswith(f"{path}/") for found in discovered)
+            or any(touches(path, pattern) for pattern in patterns)
+            for path in paths
+        ):
+            selected.append(check)
+    return selected
+
+
+def default_state_file(source: Path, docs_checkout: Path) -> Path:
+    cache_home = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    digest = hashlib.sha256(f"{source}\0{docs_checkout}".encode("utf-8")).hexdigest()[:16]
+    return cache_home / "33god" / f"doc-drift-{digest}.json"
+
+
+def build_checks(source: Path, docs_checkout: Path, cache: ArtifactCache, component_docs: bool) -> list[Check]:
+    docs = docs_checkout / "docs"
+    platform = "33god-platform"
+    return [
+        Check(
+            "root-artifacts",
+            partial(check_root_artifacts, source, docs, cache),
+            (
+                *((docs, name) for name in REQUIRED_ROOT_DOCS),
+                (docs_checkout, "_bmad/core/config.yaml"),
+                (docs_checkout, "_bmad/bmm/config.yaml"),
+            ),
+        ),
+        Check(
+            "part-declaration",
+            partial(check_part_declaration, source, docs, cache),
+            ((docs, "project-parts.json"), *((source, part) for part in PARTS)),
+        ),
+        Check(
+            "component-bmad",
+            partial(check_component_bmad, source, docs, cache),
+            tuple(
+                (root, pattern)
+                for part in PARTS
+                for root, pattern in (
+                    (source, f"{part}/_bmad/core/config.yaml"),
+                    (source, f"{part}/_bmad/bmm/config.yaml"),
+                    (source, f"{part}/_bmad/config.toml"),
+                    (source, f"{part}/docs"),
+                    (docs, f"architecture-{part}.md"),
+                    (docs, f"development-guide-{part}.md"),
+                )
+            ),
+        ),
+        Check(
+            "platform-manifest",
+            partial(check_platform_manifest, source, cache),
+            ((source, f"{platform}/components/*.yaml"), *((source, part) for part in PARTS)),
+        ),
+        Check(
+            "high-risk-contracts",
+            partial(check_high_risk_contracts, source, cache),
+            tuple(
+                (source, path)
+                for path in (
+                    "bloodbank/services/agent-hooks/core/validate.py",
+                    "bloodbank/services/heartbeat-recorder",
+                    "bloodbank/compose/docker-compose.yml",
+                    "candystore/compose.yml",
+                    "candystore/dapr-components/pubsub.yaml",
+                    "holocene/apps/api/src/fleet.ts",
+                    "pjangler/templates/hermes-agent/runtime-scaffold/bloodbank-consumer.py",
+                )
+            ),
+        ),
+        Check(
+            "root-compose",
+            partial(check_compose_candidate, source, docs_checkout),
+            (
+                (docs_checkout, f"{platform}/scripts/validate-compose.py"),
+                (docs_checkout, f"{platform}/compose.yaml"),
+                (source, "bloodbank/compose/nats/*"),
+                (source, "candystore/Dockerfile"),
+                (source, "candystore/dapr-components/*"),
+                (source, "holocene/compose.yml"),
+                (source, "holocene/.env.holocene-web"),
+                (source, "pjangler/package.json"),
+                (source, "pjangler/dist/*.js"),
+            ),
+            executables=("docker",),
+            environment=("BLOODBANK_", "CANDYSTORE_", "COMPOSE_", "DOCKER_"),
+        ),
+        Check(
+            "docs",
+            partial(check_docs, docs, source, cache, component_docs=component_docs),
+            ((docs, "*.md"), *(((source, f"{part}/docs/**/*.md") for part in PARTS) if component_docs else ())),
+        ),
+    ]
 
 
 def parse_args() -> argparse.Namespace:
@@ -305,24 +836,62 @@ def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--source-root", type=Path, default=script_root, help="live source checkout")
     parser.add_argument("--docs-root", type=Path, default=script_root, help="checkout containing root docs/config")
+    parser.add_argument("--component-docs", action="store_true", help="also link-check each part's docs/ tree")
+    parser.add_argument("--jobs", type=int, default=min(8, os.cpu_count() or 1), help="concurrent checks (1 runs serially)")
+    parser.add_argument("--force", action="store_true", help="re-evaluate every check, ignoring cached fingerprints")
+    parser.add_argument("--staged", action="store_true", help="run only checks whose inputs are staged in git")
+    parser.add_argument("--format", choices=("text", "json", "junit"), default="text", help="report format on stdout")
+    parser.add_argument("--state-file", type=Path, help="per-check fingerprint state (default: $XDG_CACHE_HOME/33god/)")
     return parser.parse_args()
 
 
 def main() -> int:
+    started = time.perf_counter()
     args = parse_args()
     source = args.source_root.expanduser().resolve()
     docs_checkout = args.docs_root.expanduser().resolve()
     docs = docs_checkout / "docs"
-    report = Reporter()
-    print(f"33GOD drift check\nsource={source}\ndocs={docs}")
-    check_root_artifacts(source, docs, report)
-    check_part_declaration(source, docs, report)
-    check_component_bmad(source, docs, report)
-    check_platform_manifest(source, report)
-    check_high_risk_contracts(source, report)
-    check_compose_candidate(source, docs_checkout, report)
-    check_docs(docs, report)
-    print(f"SUMMARY PASS={report.passes} WARN={report.warnings} FAIL={report.failures}")
+    text = args.format == "text"
+    report = Reporter(echo=text)
+    cache = ArtifactCache()
+    if text:
+        print(f"33GOD drift check\nsource={source}\ndocs={docs}")
+    checks = build_checks(source, docs_checkout, cache, args.component_docs)
+    salt = "\0".join(
+        (
+            hashlib.sha256(Path(__file__).read_bytes()).hexdigest(),
+            f"pyyaml={yaml is not None}",
+            str(source),
+            str(docs_checkout),
+        )
+    )
+    state = DriftState(args.state_file or default_state_file(source, docs_checkout), salt)
+    if args.staged:
+        paths = staged_paths(docs_checkout)
+        if paths is None:
+            print("WARN --staged: not a git checkout; running every check", file=sys.stderr)
+        else:
+            checks = affected_checks(checks, paths, state)
+            if text:
+                names = ", ".join(check.name for check in checks) or "none"
+                print(f"STAGED {len(paths)} path(s) affect: {names}")
+    results = run_checks(checks, report, state, jobs=args.jobs, force=args.force)
+    cached = sum(result.cached for result in results)
+    meta = {
+        "source": str(source),
+        "docs": str(docs),
+        "duration_s": round(time.perf_counter() - started, 6),
+        "evaluated": len(results) - cached,
+        "cached": cached,
+    }
+    if args.format == "json":
+        print(json_report(results, report, cache, meta))
+    elif args.format == "junit":
+        print(junit_report(results, report, meta))
+    else:
+        print(cache.summary())
+        print(f"INCREMENTAL evaluated={meta['evaluated']} cached={cached}")
+        print(f"SUMMARY PASS={report.passes} WARN={report.warnings} FAIL={report.failures}")
     return 1 if report.failures else 0
 
 